@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, fields
+from dataclasses import dataclass, fields, replace
+import functools
 import html
 import itertools
 import json
 import math
+import os
 from pathlib import Path
 import random
+import sys
 from typing import Any
 
 from .physics_lab import PhysicsBody, PhysicsTuning, PhysicsWorld
@@ -104,7 +107,13 @@ class SweepResult:
 
 def default_ball_classes() -> list[BallClass]:
     """기본 Ball 클래스 정의 (딜러, 탱커, 힐러, 원거리 딜러)"""
-    return [
+    # BallClass는 frozen이므로 캐시한 인스턴스를 공유하고 리스트만 새로 만든다
+    return list(_default_ball_classes())
+
+
+@functools.cache
+def _default_ball_classes() -> tuple[BallClass, ...]:
+    return (
         BallClass(
             name="딜러",
             role="dealer",
@@ -129,23 +138,28 @@ def default_ball_classes() -> list[BallClass]:
             description="원거리에서 적을 공격하는 유닛",
             base_str=6, base_dex=9, base_int=10, base_vit=7, base_wis=4,
         ),
-    ]
+    )
 
 
 def default_profiles() -> list[BallProfile]:
     """기본 프로필 (기존 호환성 유지용)"""
-    return [
+    return list(_default_profiles())
+
+
+@functools.cache
+def _default_profiles() -> tuple[BallProfile, ...]:
+    return (
         BallProfile("balanced", 1.00, 1.00, 1.00, 1.00, 1.00),
         BallProfile("duelist", 0.90, 0.95, 1.15, 1.00, 1.30),
         BallProfile("striker", 0.95, 0.88, 1.28, 0.88, 1.18),
         BallProfile("bruiser", 1.10, 1.38, 1.14, 1.42, 0.82),
         BallProfile("berserker", 1.00, 0.84, 1.46, 0.74, 1.12),
         BallProfile("juggernaut", 1.20, 1.72, 1.08, 1.84, 0.72),
-    ]
+    )
 
 
-def ball_class_to_profile(ball_class: BallClass, scale_modifier: float = 1.0) -> BallProfile:
-    """BallClass RPG 스탯을 BallProfile 배율로 변환"""
+def _ball_class_ratios(ball_class: BallClass) -> tuple[float, float, float, float, float]:
+    """(radius, mass, power, hp, speed) 배율 - STR=VIT=DEX=10 기준값 대비"""
     # STR=VIT=DEX=10 기준값
     default_radius = 28.0   # VIT=10 → 28*sqrt(1.0)=28
     default_mass = 1.0      # VIT=10 → 10/10=1.0
@@ -159,16 +173,58 @@ def ball_class_to_profile(ball_class: BallClass, scale_modifier: float = 1.0) ->
     derived_hp = float(ball_class.base_vit * 10)
     derived_speed = float(ball_class.base_dex * 25)
 
+    return (
+        derived_radius / default_radius,
+        derived_mass / default_mass,
+        derived_power / default_power,
+        derived_hp / default_hp,
+        derived_speed / default_speed,
+    )
+
+
+def ball_class_to_profile(ball_class: BallClass, scale_modifier: float = 1.0) -> BallProfile:
+    """BallClass RPG 스탯을 BallProfile 배율로 변환"""
+    radius, mass, power, hp, speed = _ball_class_ratios(ball_class)
     return BallProfile(
         name=ball_class.name,
-        radius_scale=(derived_radius / default_radius) * scale_modifier,
-        mass_scale=(derived_mass / default_mass) * scale_modifier,
-        power_scale=(derived_power / default_power) * scale_modifier,
-        hp_scale=(derived_hp / default_hp) * scale_modifier,
-        speed_scale=(derived_speed / default_speed) * scale_modifier,
+        radius_scale=radius * scale_modifier,
+        mass_scale=mass * scale_modifier,
+        power_scale=power * scale_modifier,
+        hp_scale=hp * scale_modifier,
+        speed_scale=speed * scale_modifier,
     )
 
 
+def ball_classes_to_profiles(
+    ball_classes: list[BallClass],
+    scale_modifiers: list[float] | None = None,
+) -> list[BallProfile]:
+    """여러 BallClass를 한 번에 변환 (같은 클래스의 기준 배율은 한 번만 계산)"""
+    if scale_modifiers is None:
+        scale_modifiers = [1.0] * len(ball_classes)
+    elif len(scale_modifiers) != len(ball_classes):
+        raise ValueError("scale_modifiers must match ball_classes length")
+
+    ratios_by_class: dict[BallClass, tuple[float, float, float, float, float]] = {}
+    profiles: list[BallProfile] = []
+    for ball_class, modifier in zip(ball_classes, scale_modifiers):
+        ratios = ratios_by_class.get(ball_class)
+        if ratios is None:
+            ratios = ratios_by_class[ball_class] = _ball_class_ratios(ball_class)
+        radius, mass, power, hp, speed = ratios
+        profiles.append(
+            BallProfile(
+                name=ball_class.name,
+                radius_scale=radius * modifier,
+                mass_scale=mass * modifier,
+                power_scale=power * modifier,
+                hp_scale=hp * modifier,
+                speed_scale=speed * modifier,
+            )
+        )
+    return profiles
+
+
 def _random_profile(rng: random.Random, name: str) -> BallProfile:
     return BallProfile(
         name=name,
@@ -214,16 +270,6 @@ def extract_ball_specs(settings_payload: dict[str, Any]) -> list[dict[str, Any]]
     return out
 
 
-def _default_speed_for_team(team: str, settings_values: dict[str, Any]) -> float:
-    left_speed = abs(float(settings_values.get("left_speed", 260.0)))
-    right_speed = abs(float(settings_values.get("right_speed", 210.0)))
-    if team == "left":
-        return left_speed
-    if team == "right":
-        return -right_speed
-    return 0.0
-
-
 def _default_forward_for_team(team: str) -> float:
     if team == "left":
         return 1.0
@@ -249,17 +295,42 @@ def _cooldown_from_stats(role: str, dex: int, wis: int) -> float:
     return 0.0
 
 
-def _normalize_ball_spec(raw: dict[str, Any], idx: int) -> dict[str, Any]:
-    team = str(raw.get("team", "left")).strip().lower()
+@dataclass(frozen=True, slots=True)
+class _NormalizedSpec:
+    """_normalize_ball_spec 결과 (월드 구성에 쓰는 필드만, 타입 확정)"""
+    team: str
+    role: str
+    power: float
+    mass: float
+    radius: float
+    max_hp: float
+    hp: float
+    int_stat: float
+    wis_stat: float
+    forward_dir: float
+    color: str
+    vx: float
+    vy: float
+    x: float | None
+    y: float | None
+    ability_cooldown: float
+
+
+def _optional_coord(value: Any) -> float | None:
+    if value is None or not str(value).strip():
+        return None
+    return float(value)
+
+
+def _normalize_ball_spec(raw: dict[str, Any], idx: int) -> _NormalizedSpec:
+    # team/role은 매 스텝 "left" 같은 리터럴과 비교되므로 intern 해 두면 동일 객체 비교로 끝난다
+    team = sys.intern(str(raw.get("team", "left")).strip().lower())
     if not team:
         raise ValueError(f"ball_specs[{idx}].team must not be empty")
 
-    normalized = dict(raw)
-    normalized["team"] = team
-    role = str(raw.get("role", "dealer")).strip().lower()
+    role = sys.intern(str(raw.get("role", "dealer")).strip().lower())
     if role not in {"tank", "dealer", "healer", "ranged_dealer", "ranged_healer"}:
         role = "dealer"
-    normalized["role"] = role
 
     # RPG 스탯 읽기 (1~20, 기준=10)
     str_s = max(1, int(raw.get("str_stat", 10)))
@@ -268,83 +339,84 @@ def _normalize_ball_spec(raw: dict[str, Any], idx: int) -> dict[str, Any]:
     vit_s = max(1, int(raw.get("vit_stat", 10)))
     wis_s = max(1, int(raw.get("wis_stat", 10)))
 
+    # vx: DEX에서 파생 (명시적 지정도 허용)
+    if "vx" in raw:
+        vx = float(raw["vx"])
+    elif team == "left":
+        vx = float(dex_s) * 25.0
+    elif team == "right":
+        vx = -(float(dex_s) * 25.0)
+    else:
+        vx = 0.0
+
     # 물리값 파생
-    normalized["power"]    = str_s / 10.0
-    normalized["mass"]     = vit_s / 10.0
-    normalized["radius"]   = 28.0 * math.sqrt(vit_s / 10.0)
-    normalized["max_hp"]   = float(vit_s * 10)
+    max_hp = float(vit_s * 10)
     hp_raw = float(raw.get("hp", vit_s * 10))
-    normalized["hp"]       = min(hp_raw, normalized["max_hp"])
-    normalized["int_stat"] = float(int_s)
-    normalized["wis_stat"] = float(wis_s)
-
-    normalized["forward_dir"] = float(raw.get("forward_dir", _default_forward_for_team(team)))
-    normalized["color"] = str(raw.get("color", _default_color_for_team(team)))
-    normalized["vy"] = float(raw.get("vy", 0.0))
-    normalized["x"] = raw.get("x")
-    normalized["y"] = raw.get("y")
-    # 쿨다운: DEX/WIS에서 자동 파생 (JSON에서 명시적 지정도 허용)
-    normalized["ability_cooldown"] = float(
-        raw.get("ability_cooldown", _cooldown_from_stats(role, dex_s, wis_s))
+    return _NormalizedSpec(
+        team=team,
+        role=role,
+        power=str_s / 10.0,
+        mass=vit_s / 10.0,
+        radius=28.0 * math.sqrt(vit_s / 10.0),
+        max_hp=max_hp,
+        hp=min(hp_raw, max_hp),
+        int_stat=float(int_s),
+        wis_stat=float(wis_s),
+        forward_dir=float(raw.get("forward_dir", _default_forward_for_team(team))),
+        color=str(raw.get("color", _default_color_for_team(team))),
+        vx=vx,
+        vy=float(raw.get("vy", 0.0)),
+        x=_optional_coord(raw.get("x")),
+        y=_optional_coord(raw.get("y")),
+        # 쿨다운: DEX/WIS에서 자동 파생 (JSON에서 명시적 지정도 허용)
+        ability_cooldown=float(
+            raw.get("ability_cooldown", _cooldown_from_stats(role, dex_s, wis_s))
+        ),
     )
-    # vx: DEX에서 파생 (명시적 지정도 허용)
-    if "vx" not in raw:
-        if team == "left":
-            normalized["vx"] = float(dex_s) * 25.0
-        elif team == "right":
-            normalized["vx"] = -(float(dex_s) * 25.0)
-        else:
-            normalized["vx"] = 0.0
-    return normalized
 
 
 def _apply_profile(
-    spec: dict[str, Any],
+    spec: _NormalizedSpec,
     profile: BallProfile,
-    settings_values: dict[str, Any],
-    rng: random.Random,
-    speed_jitter: float,
-) -> dict[str, Any]:
-    out = dict(spec)
-    out["radius"] = max(6.0, float(spec["radius"]) * profile.radius_scale)
-    out["mass"] = max(0.2, float(spec["mass"]) * profile.mass_scale)
-    out["power"] = max(0.1, float(spec["power"]) * profile.power_scale)
-    out["max_hp"] = max(1.0, float(spec["max_hp"]) * profile.hp_scale)
-    out["hp"] = min(out["max_hp"], max(0.0, float(spec["hp"]) * profile.hp_scale))
-
-    team = str(spec["team"]).strip().lower()
-    base_speed = float(spec.get("vx", _default_speed_for_team(team, settings_values)))
-    direction = 1.0 if base_speed >= 0 else -1.0
-    scaled_speed = abs(base_speed) * profile.speed_scale
-    scaled_speed += rng.uniform(-speed_jitter, speed_jitter)
-    out["vx"] = direction * max(8.0, scaled_speed)
-    out["vy"] = float(spec.get("vy", 0.0))
-    return out
+    jitter: float,
+) -> _NormalizedSpec:
+    """jitter: 이미 뽑아 둔 속도 흔들림 값 (seed별 rng에서 spec 순서대로)"""
+    max_hp = max(1.0, spec.max_hp * profile.hp_scale)
+    direction = 1.0 if spec.vx >= 0 else -1.0
+    scaled_speed = abs(spec.vx) * profile.speed_scale
+    scaled_speed += jitter
+    return replace(
+        spec,
+        radius=max(6.0, spec.radius * profile.radius_scale),
+        mass=max(0.2, spec.mass * profile.mass_scale),
+        power=max(0.1, spec.power * profile.power_scale),
+        max_hp=max_hp,
+        hp=min(max_hp, max(0.0, spec.hp * profile.hp_scale)),
+        vx=direction * max(8.0, scaled_speed),
+    )
 
 
-def _build_world_from_specs(
+def _build_world_from_normalized_specs(
     *,
     width: float,
     height: float,
     side_margin: float,
-    settings_values: dict[str, Any],
     tuning: PhysicsTuning,
-    specs: list[dict[str, Any]],
+    specs: list[_NormalizedSpec],
     invincible_teams: set[str] | None = None,
 ) -> PhysicsWorld:
+    """_normalize_ball_spec(+_apply_profile)을 이미 거친 spec으로 월드 구성"""
     team_slots: dict[str, int] = {"left": 0, "right": 0}
     bodies: list[PhysicsBody] = []
-    for idx, raw in enumerate(specs):
-        spec = _normalize_ball_spec(raw, idx)
-        team = str(spec["team"])
-        radius = float(spec["radius"])
+    for idx, spec in enumerate(specs):
+        team = spec.team
+        radius = spec.radius
         slot = team_slots.get(team, 0)
         team_slots[team] = slot + 1
         spacing = radius * 2.3
 
-        x_raw = spec.get("x")
-        if x_raw is not None and str(x_raw).strip():
-            x = float(x_raw)
+        if spec.x is not None:
+            x = spec.x
         elif team == "left":
             x = side_margin + radius + (slot * spacing)
         elif team == "right":
@@ -352,36 +424,31 @@ def _build_world_from_specs(
         else:
             x = (width * 0.5) + ((slot - 0.5) * spacing)
 
-        y_raw = spec.get("y")
-        if y_raw is not None and str(y_raw).strip():
-            y = float(y_raw)
-        else:
-            y = height - radius
+        y = spec.y if spec.y is not None else height - radius
 
         x = min(width - radius, max(radius, x))
         y = min(height - radius, max(radius, y))
 
-        raw_vx = float(spec.get("vx", _default_speed_for_team(team, settings_values)))
         bodies.append(
             PhysicsBody(
                 body_id=idx,
                 team=team,
                 x=x,
                 y=y,
-                vx=raw_vx,
-                vy=float(spec.get("vy", 0.0)),
+                vx=spec.vx,
+                vy=spec.vy,
                 radius=radius,
-                mass=float(spec["mass"]),
-                color=str(spec["color"]),
-                power=float(spec["power"]),
-                role=str(spec.get("role", "dealer")),
-                forward_dir=float(spec["forward_dir"]),
-                max_hp=float(spec["max_hp"]),
-                hp=float(spec["hp"]),
-                speed=max(1.0, abs(raw_vx)),
-                base_cooldown=float(spec.get("ability_cooldown", 0.0)),
-                int_stat=float(spec.get("int_stat", 10.0)),
-                wis_stat=float(spec.get("wis_stat", 10.0)),
+                mass=spec.mass,
+                color=spec.color,
+                power=spec.power,
+                role=spec.role,
+                forward_dir=spec.forward_dir,
+                max_hp=spec.max_hp,
+                hp=spec.hp,
+                speed=max(1.0, abs(spec.vx)),
+                base_cooldown=spec.ability_cooldown,
+                int_stat=spec.int_stat,
+                wis_stat=spec.wis_stat,
             )
         )
 
@@ -399,8 +466,18 @@ def _team_hp(world: PhysicsWorld, team: str) -> float:
 
 
 def _winner_from_world(world: PhysicsWorld) -> str:
-    left_alive = any(body.team == "left" and body.is_alive for body in world.bodies)
-    right_alive = any(body.team == "right" and body.is_alive for body in world.bodies)
+    # 생존 여부는 한 번 순회로 확인하고, 양 팀이 모두 살아 있을 때(시간 종료)만 HP 합산
+    left_alive = False
+    right_alive = False
+    for body in world.bodies:
+        if body.hp <= 0:
+            continue
+        if body.team == "left":
+            left_alive = True
+        elif body.team == "right":
+            right_alive = True
+        if left_alive and right_alive:
+            break
     if left_alive and not right_alive:
         return "left"
     if right_alive and not left_alive:
@@ -432,19 +509,20 @@ def simulate_run(
     time_to_first_collision: float | None = None
     collision_bursts = 0
     peak_speed = world.max_speed()
+    peak_speed_sq = 0.0
     airborne_acc = 0.0
     airborne_samples = 0
     lead_changes = 0
     fight_end_time = duration
 
-    initial_left_hp = _team_hp(world, "left")
-    initial_right_hp = _team_hp(world, "right")
-    prev_lead = 0
+    # 팀 구성은 실행 중 바뀌지 않으므로 팀별 바디 목록은 한 번만 만든다
+    left_bodies = [body for body in world.bodies if body.team == "left"]
+    right_bodies = [body for body in world.bodies if body.team == "right"]
+    initial_left_hp = sum(body.hp for body in left_bodies)
+    initial_right_hp = sum(body.hp for body in right_bodies)
+    # 우세 팀 부호: +1(left) / -1(right) / 0(동률), bool 뺄셈으로 분기 없이 계산
     hp_diff_start = initial_left_hp - initial_right_hp
-    if hp_diff_start > 1e-6:
-        prev_lead = 1
-    elif hp_diff_start < -1e-6:
-        prev_lead = -1
+    prev_lead = (hp_diff_start > 1e-6) - (hp_diff_start < -1e-6)
 
     for step_idx in range(steps):
         world.step(dt)
@@ -454,32 +532,44 @@ def simulate_run(
             if time_to_first_collision is None:
                 time_to_first_collision = (step_idx + 1) * dt
 
-        peak_speed = max(peak_speed, world.max_speed())
+        # 팀 HP 합, 생존 여부, 체공 샘플, 최고 속도(제곱)를 바디 한 번 순회로 함께 집계
+        left_hp = 0
+        right_hp = 0
+        left_alive = False
+        right_alive = False
         for body in world.bodies:
-            if body.is_alive:
+            hp = body.hp
+            team = body.team
+            if team == "left":
+                left_hp += hp
+                if hp > 0:
+                    left_alive = True
+            elif team == "right":
+                right_hp += hp
+                if hp > 0:
+                    right_alive = True
+            if hp > 0:
+                speed_sq = body.vx * body.vx + body.vy * body.vy
+                if speed_sq > peak_speed_sq:
+                    peak_speed_sq = speed_sq
                 airborne_samples += 1
                 if not _is_grounded(world, body):
                     airborne_acc += 1.0
 
-        hp_diff = _team_hp(world, "left") - _team_hp(world, "right")
-        lead = 0
-        if hp_diff > 1e-6:
-            lead = 1
-        elif hp_diff < -1e-6:
-            lead = -1
+        hp_diff = left_hp - right_hp
+        lead = (hp_diff > 1e-6) - (hp_diff < -1e-6)
         if prev_lead != 0 and lead != 0 and lead != prev_lead:
             lead_changes += 1
         if lead != 0:
             prev_lead = lead
 
-        left_alive = any(body.team == "left" and body.is_alive for body in world.bodies)
-        right_alive = any(body.team == "right" and body.is_alive for body in world.bodies)
         if not left_alive or not right_alive:
             fight_end_time = (step_idx + 1) * dt
             break
 
-    final_left_hp = _team_hp(world, "left")
-    final_right_hp = _team_hp(world, "right")
+    peak_speed = max(peak_speed, math.sqrt(peak_speed_sq))
+    final_left_hp = sum(body.hp for body in left_bodies)
+    final_right_hp = sum(body.hp for body in right_bodies)
     damage_done = (initial_left_hp + initial_right_hp) - (final_left_hp + final_right_hp)
     collisions = max(0, world.total_collisions)
     elapsed = max(dt, world.time_elapsed)
@@ -505,6 +595,44 @@ def simulate_run(
     )
 
 
+@dataclass(frozen=True, slots=True)
+class _SeedRun:
+    """워커 프로세스로 넘길 수 있는 seed 1회 실행 단위"""
+    width: float
+    height: float
+    side_margin: float
+    tuning: PhysicsTuning
+    specs: list[_NormalizedSpec]
+    invincible_teams: set[str]
+    duration: float
+    dt: float
+
+
+def _run_seed(job: _SeedRun) -> RunMetrics:
+    world = _build_world_from_normalized_specs(
+        width=job.width,
+        height=job.height,
+        side_margin=job.side_margin,
+        tuning=job.tuning,
+        specs=job.specs,
+        invincible_teams=job.invincible_teams,
+    )
+    return simulate_run(world=world, duration=job.duration, dt=job.dt)
+
+
+def _run_seed_jobs(jobs: list[_SeedRun], workers: int | None) -> list[RunMetrics]:
+    """jobs 순서대로 결과 반환 (workers=1이면 현재 프로세스에서 순차 실행)"""
+    max_workers = workers or os.cpu_count() or 1
+    if max_workers == 1 or len(jobs) <= 1:
+        return [_run_seed(job) for job in jobs]
+    # multiprocessing 계열 import는 무거우므로 실제로 풀을 쓸 때만 불러온다
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunksize = max(1, len(jobs) // (max_workers * 4))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_run_seed, jobs, chunksize=chunksize))
+
+
 def _score_metric(value: float, target: float, tolerance: float) -> float:
     if tolerance <= 0:
         return 0.0
@@ -541,24 +669,48 @@ def _aggregate_summaries(
     if run_count == 0:
         raise ValueError("runs must not be empty")
 
-    left_wins = sum(1 for run in runs if run.winner == "left")
-    avg_score = sum(score_metrics(run) for run in runs) / run_count
+    # 11개 지표를 한 번의 순회로 누적 (필드별 합산 순서는 그대로 유지)
+    left_wins = 0
+    score_sum = 0.0
+    duration_sum = 0.0
+    fight_end_sum = 0.0
+    collisions_rate_sum = 0.0
+    damage_rate_sum = 0.0
+    damage_per_collision_sum = 0.0
+    air_ratio_sum = 0.0
+    lead_changes_sum = 0
+    collision_bursts_sum = 0
+    peak_speed_sum = 0.0
+    for run in runs:
+        if run.winner == "left":
+            left_wins += 1
+        score_sum += score_metrics(run)
+        duration_sum += run.duration
+        fight_end_sum += run.fight_end_time
+        collisions_rate_sum += run.collisions_per_second
+        damage_rate_sum += run.damage_per_second
+        damage_per_collision_sum += run.damage_per_collision
+        air_ratio_sum += run.air_ratio
+        lead_changes_sum += run.lead_changes
+        collision_bursts_sum += run.collision_bursts
+        peak_speed_sum += run.peak_speed
+
     return ScenarioSummary(
         scenario_name=scenario_name,
         left_profile=left_profile,
         right_profile=right_profile,
         run_count=run_count,
-        score=round(avg_score, 2),
+        score=round(score_sum / run_count, 2),
         win_rate_left=left_wins / run_count,
-        avg_duration=sum(run.duration for run in runs) / run_count,
-        avg_fight_end_time=sum(run.fight_end_time for run in runs) / run_count,
-        avg_collisions_per_second=sum(run.collisions_per_second for run in runs) / run_count,
-        avg_damage_per_second=sum(run.damage_per_second for run in runs) / run_count,
-        avg_damage_per_collision=sum(run.damage_per_collision for run in runs) / run_count,
-        avg_air_ratio=sum(run.air_ratio for run in runs) / run_count,
-        avg_lead_changes=sum(float(run.lead_changes) for run in runs) / run_count,
-        avg_collision_bursts=sum(float(run.collision_bursts) for run in runs) / run_count,
-        avg_peak_speed=sum(run.peak_speed for run in runs) / run_count,
+        avg_duration=duration_sum / run_count,
+        avg_fight_end_time=fight_end_sum / run_count,
+        avg_collisions_per_second=collisions_rate_sum / run_count,
+        avg_damage_per_second=damage_rate_sum / run_count,
+        avg_damage_per_collision=damage_per_collision_sum / run_count,
+        avg_air_ratio=air_ratio_sum / run_count,
+        avg_lead_changes=lead_changes_sum / run_count,
+        avg_collision_bursts=collision_bursts_sum / run_count,
+        avg_peak_speed=peak_speed_sum / run_count,
     )
 
 
@@ -618,6 +770,7 @@ def run_profile_sweep_from_settings_payload(
     speed_jitter: float = 12.0,
     width: float = DEFAULT_WORLD_WIDTH,
     height: float = DEFAULT_WORLD_HEIGHT,
+    workers: int | None = 1,
 ) -> SweepResult:
     if seeds <= 0:
         raise ValueError("seeds must be > 0")
@@ -627,6 +780,8 @@ def run_profile_sweep_from_settings_payload(
         raise ValueError("speed_jitter must be >= 0")
     if width <= 0 or height <= 0:
         raise ValueError("width/height must be > 0")
+    if workers is not None and workers <= 0:
+        raise ValueError("workers must be > 0")
 
     settings_values = settings_payload.get("values", {})
     if not isinstance(settings_values, dict):
@@ -648,43 +803,64 @@ def run_profile_sweep_from_settings_payload(
                 invincible_teams.add(team_name)
 
     profile_pool = profiles or default_profiles()
-    scenarios: list[ScenarioSummary] = []
-    for left_profile, right_profile in itertools.product(profile_pool, profile_pool):
-        runs: list[RunMetrics] = []
-        for seed in range(seeds):
-            rng = random.Random(seed)
-            shaped_specs: list[dict[str, Any]] = []
-            for spec in base_specs:
-                team = str(spec["team"]).strip().lower()
-                profile = left_profile if team == "left" else right_profile
-                shaped_specs.append(
-                    _apply_profile(
-                        spec=spec,
-                        profile=profile,
-                        settings_values=settings_values,
-                        rng=rng,
-                        speed_jitter=speed_jitter,
-                    )
+    # seed의 jitter는 spec 순서대로 한 번씩 뽑히므로 (seed, spec)에만 의존한다.
+    # 따라서 프로필별로 한 번만 spec을 가공해 두고 매치업끼리 공유한다.
+    seed_jitters: list[list[float]] = []
+    for seed in range(seeds):
+        rng = random.Random(seed)
+        seed_jitters.append([rng.uniform(-speed_jitter, speed_jitter) for _ in base_specs])
+    shaped_by_profile: list[list[list[_NormalizedSpec]]] = [
+        [
+            [
+                _apply_profile(
+                    spec=spec,
+                    profile=profile,
+                    jitter=jitters[spec_idx],
                 )
+                for spec_idx, spec in enumerate(base_specs)
+            ]
+            for jitters in seed_jitters
+        ]
+        for profile in profile_pool
+    ]
+    is_left = [spec.team == "left" for spec in base_specs]
 
-            world = _build_world_from_specs(
-                width=width,
-                height=height,
-                side_margin=side_margin,
-                settings_values=settings_values,
-                tuning=tuning,
-                specs=shaped_specs,
-                invincible_teams=invincible_teams,
+    matchups: list[tuple[BallProfile, BallProfile]] = []
+    jobs: list[_SeedRun] = []
+    profile_indices = range(len(profile_pool))
+    for left_idx, right_idx in itertools.product(profile_indices, profile_indices):
+        matchups.append((profile_pool[left_idx], profile_pool[right_idx]))
+        for seed in range(seeds):
+            left_shaped = shaped_by_profile[left_idx][seed]
+            right_shaped = shaped_by_profile[right_idx][seed]
+            shaped_specs = [
+                left_shaped[spec_idx] if left else right_shaped[spec_idx]
+                for spec_idx, left in enumerate(is_left)
+            ]
+
+            jobs.append(
+                _SeedRun(
+                    width=width,
+                    height=height,
+                    side_margin=side_margin,
+                    tuning=tuning,
+                    specs=shaped_specs,
+                    invincible_teams=invincible_teams,
+                    duration=duration,
+                    dt=dt,
+                )
             )
-            runs.append(simulate_run(world=world, duration=duration, dt=dt))
 
+    all_runs = _run_seed_jobs(jobs, workers)
+    scenarios: list[ScenarioSummary] = []
+    for matchup_idx, (left_profile, right_profile) in enumerate(matchups):
         scenario_name = f"L:{left_profile.name} vs R:{right_profile.name}"
         scenarios.append(
             _aggregate_summaries(
                 scenario_name=scenario_name,
                 left_profile=left_profile,
                 right_profile=right_profile,
-                runs=runs,
+                runs=all_runs[matchup_idx * seeds:(matchup_idx + 1) * seeds],
             )
         )
 
@@ -713,6 +889,7 @@ def run_profile_sweep(
     speed_jitter: float = 12.0,
     width: float = DEFAULT_WORLD_WIDTH,
     height: float = DEFAULT_WORLD_HEIGHT,
+    workers: int | None = 1,
 ) -> SweepResult:
     payload = load_settings_payload(settings_path)
     return run_profile_sweep_from_settings_payload(
@@ -726,6 +903,7 @@ def run_profile_sweep(
         speed_jitter=speed_jitter,
         width=width,
         height=height,
+        workers=workers,
     )
 
 
@@ -742,6 +920,7 @@ def run_random_profile_sweep_from_settings_payload(
     speed_jitter: float = 12.0,
     width: float = DEFAULT_WORLD_WIDTH,
     height: float = DEFAULT_WORLD_HEIGHT,
+    workers: int | None = 1,
 ) -> SweepResult:
     if scenario_count <= 0:
         raise ValueError("scenario_count must be > 0")
@@ -753,6 +932,8 @@ def run_random_profile_sweep_from_settings_payload(
         raise ValueError("speed_jitter must be >= 0")
     if width <= 0 or height <= 0:
         raise ValueError("width/height must be > 0")
+    if workers is not None and workers <= 0:
+        raise ValueError("workers must be > 0")
 
     settings_values = settings_payload.get("values", {})
     if not isinstance(settings_values, dict):
@@ -774,46 +955,48 @@ def run_random_profile_sweep_from_settings_payload(
                 invincible_teams.add(team_name)
 
     profile_rng = random.Random(profile_seed)
-    scenarios: list[ScenarioSummary] = []
+    matchups: list[tuple[BallProfile, BallProfile]] = []
+    jobs: list[_SeedRun] = []
     for scenario_idx in range(scenario_count):
         left_profile = _random_profile(profile_rng, f"randL-{scenario_idx + 1:03d}")
         right_profile = _random_profile(profile_rng, f"randR-{scenario_idx + 1:03d}")
-        runs: list[RunMetrics] = []
+        matchups.append((left_profile, right_profile))
 
         for seed in range(seeds):
             rng = random.Random((profile_seed * 100003) + (scenario_idx * 997) + seed)
-            shaped_specs: list[dict[str, Any]] = []
-            for spec in base_specs:
-                team = str(spec["team"]).strip().lower()
-                profile = left_profile if team == "left" else right_profile
-                shaped_specs.append(
-                    _apply_profile(
-                        spec=spec,
-                        profile=profile,
-                        settings_values=settings_values,
-                        rng=rng,
-                        speed_jitter=speed_jitter,
-                    )
+            jitters = [rng.uniform(-speed_jitter, speed_jitter) for _ in base_specs]
+            shaped_specs = [
+                _apply_profile(
+                    spec=spec,
+                    profile=left_profile if spec.team == "left" else right_profile,
+                    jitter=jitter,
+                )
+                for spec, jitter in zip(base_specs, jitters)
+            ]
+
+            jobs.append(
+                _SeedRun(
+                    width=width,
+                    height=height,
+                    side_margin=side_margin,
+                    tuning=tuning,
+                    specs=shaped_specs,
+                    invincible_teams=invincible_teams,
+                    duration=duration,
+                    dt=dt,
                 )
-
-            world = _build_world_from_specs(
-                width=width,
-                height=height,
-                side_margin=side_margin,
-                settings_values=settings_values,
-                tuning=tuning,
-                specs=shaped_specs,
-                invincible_teams=invincible_teams,
             )
-            runs.append(simulate_run(world=world, duration=duration, dt=dt))
 
+    all_runs = _run_seed_jobs(jobs, workers)
+    scenarios: list[ScenarioSummary] = []
+    for matchup_idx, (left_profile, right_profile) in enumerate(matchups):
         scenario_name = f"L:{left_profile.name} vs R:{right_profile.name}"
         scenarios.append(
             _aggregate_summaries(
                 scenario_name=scenario_name,
                 left_profile=left_profile,
                 right_profile=right_profile,
-                runs=runs,
+                runs=all_runs[matchup_idx * seeds:(matchup_idx + 1) * seeds],
             )
         )
 
@@ -843,6 +1026,7 @@ def run_random_profile_sweep(
     speed_jitter: float = 12.0,
     width: float = DEFAULT_WORLD_WIDTH,
     height: float = DEFAULT_WORLD_HEIGHT,
+    workers: int | None = 1,
 ) -> SweepResult:
     payload = load_settings_payload(settings_path)
     return run_random_profile_sweep_from_settings_payload(
@@ -857,6 +1041,7 @@ def run_random_profile_sweep(
         speed_jitter=speed_jitter,
         width=width,
         height=height,
+        workers=workers,
     )
 
 
@@ -892,19 +1077,23 @@ def sweep_result_to_markdown(result: SweepResult) -> str:
     lines.append("")
     lines.append("| 진영 | 프로필 | 반지름 | 질량 | 파워 | HP | 속도 |")
     lines.append("|---|---|---:|---:|---:|---:|---:|")
-    seen: set[str] = set()
+    # 같은 진영/프로필은 여러 시나리오에 반복 등장하므로 처음 나올 때만 행을 만든다
+    profile_rows: dict[tuple[str, str], str] = {}
     for scenario in result.top_scenarios:
         for side, profile in (("left", scenario.left_profile), ("right", scenario.right_profile)):
-            key = f"{side}:{profile.name}"
-            if key in seen:
-                continue
-            seen.add(key)
-            lines.append(
-                f"| {side} | {profile.name} | {profile.radius_scale:.2f} | {profile.mass_scale:.2f} | "
-                f"{profile.power_scale:.2f} | {profile.hp_scale:.2f} | {profile.speed_scale:.2f} |"
-            )
+            key = (side, profile.name)
+            if key not in profile_rows:
+                profile_rows[key] = (
+                    f"| {side} | {profile.name} | {profile.radius_scale:.2f} | {profile.mass_scale:.2f} | "
+                    f"{profile.power_scale:.2f} | {profile.hp_scale:.2f} | {profile.speed_scale:.2f} |"
+                )
+    lines.extend(profile_rows.values())
 
-    return "\n".join(lines).strip() + "\n"
+    # 첫 줄은 제목, 마지막 줄은 표 행이라 앞뒤 공백이 없으므로 strip 없이 바로 결합
+    return "\n".join(lines) + "\n"
+
+
+_BAR_TEMPLATE = '<div class="bar"><span style="width:{:.1f}%"></span></div>'.format
 
 
 def _metric_bar(value: float, cap: float) -> str:
@@ -912,7 +1101,80 @@ def _metric_bar(value: float, cap: float) -> str:
         width = 0.0
     else:
         width = max(0.0, min(100.0, (value / cap) * 100.0))
-    return f'<div class="bar"><span style="width:{width:.1f}%"></span></div>'
+    return _BAR_TEMPLATE(width)
+
+
+_HTML_ROW_TEMPLATE = (
+    "<tr>"
+    "<td>{rank}</td>"
+    "<td>{name}</td>"
+    "<td>{score:.2f}{score_bar}</td>"
+    "<td>{collisions:.2f}{collisions_bar}</td>"
+    "<td>{damage:.2f}{damage_bar}</td>"
+    "<td>{air:.2f}{air_bar}</td>"
+    "<td>{lead:.2f}{lead_bar}</td>"
+    "</tr>"
+)
+
+# 정적 골격은 모듈 로드 시 한 번만 만든다 (CSS 중괄호가 format과 겹치지 않도록 head는 따로 둠)
+_HTML_HEAD = (
+    "<!doctype html>"
+    "<html lang=\"ko\">"
+    "<head>"
+    "<meta charset=\"utf-8\">"
+    "<meta name=\"viewport\" content=\"width=device-width, initial-scale=1\">"
+    "<title>전투감 리포트</title>"
+    "<style>"
+    ":root{--bg:#0d1117;--panel:#161b22;--line:#2a3544;--text:#e6edf3;--muted:#94a3b8;--accent:#22c55e;}"
+    "body{margin:0;font-family:Segoe UI,Arial,sans-serif;background:radial-gradient(circle at 20% 0%,#1a2330 0,#0d1117 45%);color:var(--text);}"
+    ".wrap{max-width:1100px;margin:24px auto;padding:0 16px;}"
+    ".card{background:var(--panel);border:1px solid var(--line);border-radius:12px;padding:16px;margin-bottom:14px;}"
+    "h1,h2{margin:0 0 10px 0;}"
+    ".meta{display:grid;grid-template-columns:repeat(auto-fit,minmax(170px,1fr));gap:10px;}"
+    ".meta div{background:#0f1520;border:1px solid var(--line);border-radius:8px;padding:8px 10px;}"
+    ".meta b{display:block;color:var(--muted);font-weight:600;font-size:12px;}"
+    ".meta span{font-size:15px;}"
+    "table{width:100%;border-collapse:collapse;font-size:14px;}"
+    "th,td{padding:8px;border-bottom:1px solid var(--line);vertical-align:top;}"
+    "th{color:var(--muted);text-align:left;}"
+    ".bar{height:6px;background:#1f2937;border-radius:6px;overflow:hidden;margin-top:4px;}"
+    ".bar span{display:block;height:100%;background:linear-gradient(90deg,#22c55e,#16a34a);}"
+    "ul{margin:0;padding-left:20px;}"
+    "</style>"
+    "</head>"
+)
+
+_HTML_BODY_TEMPLATE = (
+    "<body>"
+    "<div class=\"wrap\">"
+    "<div class=\"card\">"
+    "<h1>전투감 시뮬레이션 리포트</h1>"
+    "<div class=\"meta\">"
+    "<div><b>설정 파일</b><span>{settings_path}</span></div>"
+    "<div><b>시나리오 수</b><span>{scenario_count}</span></div>"
+    "<div><b>시나리오당 반복</b><span>{seeds}</span></div>"
+    "<div><b>1회 실행 시간</b><span>{duration:.2f}s</span></div>"
+    "<div><b>물리 dt</b><span>{dt:.5f}s</span></div>"
+    "</div>"
+    "</div>"
+    "<div class=\"card\">"
+    "<h2>상위 시나리오</h2>"
+    "<table>"
+    "<thead><tr>"
+    "<th>순위</th><th>시나리오</th><th>점수</th><th>충돌/초</th>"
+    "<th>피해/초</th><th>체공 비율</th><th>리드 전환</th>"
+    "</tr></thead>"
+    "<tbody>{rows}</tbody>"
+    "</table>"
+    "</div>"
+    "<div class=\"card\">"
+    "<h2>개선 제안</h2>"
+    "<ul>{recs}</ul>"
+    "</div>"
+    "</div>"
+    "</body>"
+    "</html>"
+)
 
 
 def sweep_result_to_html(result: SweepResult) -> str:
@@ -923,78 +1185,54 @@ def sweep_result_to_html(result: SweepResult) -> str:
     max_air = max((s.avg_air_ratio for s in top), default=1.0)
     max_lead = max((s.avg_lead_changes for s in top), default=1.0)
 
-    rows: list[str] = []
-    for rank, scenario in enumerate(top, start=1):
-        rows.append(
-            "<tr>"
-            f"<td>{rank}</td>"
-            f"<td>{html.escape(scenario.scenario_name)}</td>"
-            f"<td>{scenario.score:.2f}{_metric_bar(scenario.score, max_score)}</td>"
-            f"<td>{scenario.avg_collisions_per_second:.2f}{_metric_bar(scenario.avg_collisions_per_second, max_collision)}</td>"
-            f"<td>{scenario.avg_damage_per_second:.2f}{_metric_bar(scenario.avg_damage_per_second, max_damage)}</td>"
-            f"<td>{scenario.avg_air_ratio:.2f}{_metric_bar(scenario.avg_air_ratio, max_air)}</td>"
-            f"<td>{scenario.avg_lead_changes:.2f}{_metric_bar(scenario.avg_lead_changes, max_lead)}</td>"
-            "</tr>"
+    rows = "".join(
+        _HTML_ROW_TEMPLATE.format_map(
+            {
+                "rank": rank,
+                "name": html.escape(scenario.scenario_name),
+                "score": scenario.score,
+                "score_bar": _metric_bar(scenario.score, max_score),
+                "collisions": scenario.avg_collisions_per_second,
+                "collisions_bar": _metric_bar(scenario.avg_collisions_per_second, max_collision),
+                "damage": scenario.avg_damage_per_second,
+                "damage_bar": _metric_bar(scenario.avg_damage_per_second, max_damage),
+                "air": scenario.avg_air_ratio,
+                "air_bar": _metric_bar(scenario.avg_air_ratio, max_air),
+                "lead": scenario.avg_lead_changes,
+                "lead_bar": _metric_bar(scenario.avg_lead_changes, max_lead),
+            }
         )
+        for rank, scenario in enumerate(top, start=1)
+    )
 
     rec_items = "".join(f"<li>{html.escape(rec)}</li>" for rec in result.recommendations)
-    return (
-        "<!doctype html>"
-        "<html lang=\"ko\">"
-        "<head>"
-        "<meta charset=\"utf-8\">"
-        "<meta name=\"viewport\" content=\"width=device-width, initial-scale=1\">"
-        "<title>전투감 리포트</title>"
-        "<style>"
-        ":root{--bg:#0d1117;--panel:#161b22;--line:#2a3544;--text:#e6edf3;--muted:#94a3b8;--accent:#22c55e;}"
-        "body{margin:0;font-family:Segoe UI,Arial,sans-serif;background:radial-gradient(circle at 20% 0%,#1a2330 0,#0d1117 45%);color:var(--text);}"
-        ".wrap{max-width:1100px;margin:24px auto;padding:0 16px;}"
-        ".card{background:var(--panel);border:1px solid var(--line);border-radius:12px;padding:16px;margin-bottom:14px;}"
-        "h1,h2{margin:0 0 10px 0;}"
-        ".meta{display:grid;grid-template-columns:repeat(auto-fit,minmax(170px,1fr));gap:10px;}"
-        ".meta div{background:#0f1520;border:1px solid var(--line);border-radius:8px;padding:8px 10px;}"
-        ".meta b{display:block;color:var(--muted);font-weight:600;font-size:12px;}"
-        ".meta span{font-size:15px;}"
-        "table{width:100%;border-collapse:collapse;font-size:14px;}"
-        "th,td{padding:8px;border-bottom:1px solid var(--line);vertical-align:top;}"
-        "th{color:var(--muted);text-align:left;}"
-        ".bar{height:6px;background:#1f2937;border-radius:6px;overflow:hidden;margin-top:4px;}"
-        ".bar span{display:block;height:100%;background:linear-gradient(90deg,#22c55e,#16a34a);}"
-        "ul{margin:0;padding-left:20px;}"
-        "</style>"
-        "</head>"
-        "<body>"
-        "<div class=\"wrap\">"
-        "<div class=\"card\">"
-        "<h1>전투감 시뮬레이션 리포트</h1>"
-        "<div class=\"meta\">"
-        f"<div><b>설정 파일</b><span>{html.escape(result.settings_path)}</span></div>"
-        f"<div><b>시나리오 수</b><span>{result.scenario_count}</span></div>"
-        f"<div><b>시나리오당 반복</b><span>{result.seeds}</span></div>"
-        f"<div><b>1회 실행 시간</b><span>{result.duration:.2f}s</span></div>"
-        f"<div><b>물리 dt</b><span>{result.dt:.5f}s</span></div>"
-        "</div>"
-        "</div>"
-        "<div class=\"card\">"
-        "<h2>상위 시나리오</h2>"
-        "<table>"
-        "<thead><tr>"
-        "<th>순위</th><th>시나리오</th><th>점수</th><th>충돌/초</th>"
-        "<th>피해/초</th><th>체공 비율</th><th>리드 전환</th>"
-        "</tr></thead>"
-        f"<tbody>{''.join(rows)}</tbody>"
-        "</table>"
-        "</div>"
-        "<div class=\"card\">"
-        "<h2>개선 제안</h2>"
-        f"<ul>{rec_items}</ul>"
-        "</div>"
-        "</div>"
-        "</body>"
-        "</html>"
+    return _HTML_HEAD + _HTML_BODY_TEMPLATE.format(
+        settings_path=html.escape(result.settings_path),
+        scenario_count=result.scenario_count,
+        seeds=result.seeds,
+        duration=result.duration,
+        dt=result.dt,
+        rows=rows,
+        recs=rec_items,
     )
 
 
+_PROFILE_FIELD_NAMES = tuple(f.name for f in fields(BallProfile))
+_SCENARIO_FIELD_NAMES = tuple(f.name for f in fields(ScenarioSummary))
+
+
+def _profile_to_dict(profile: BallProfile) -> dict[str, Any]:
+    return {name: getattr(profile, name) for name in _PROFILE_FIELD_NAMES}
+
+
+def _scenario_to_dict(scenario: ScenarioSummary) -> dict[str, Any]:
+    """asdict와 같은 키 순서, 단 프로필을 한 번만 변환하고 deepcopy 없이 구성"""
+    out = {name: getattr(scenario, name) for name in _SCENARIO_FIELD_NAMES}
+    out["left_profile"] = _profile_to_dict(scenario.left_profile)
+    out["right_profile"] = _profile_to_dict(scenario.right_profile)
+    return out
+
+
 def sweep_result_to_json_dict(result: SweepResult) -> dict[str, Any]:
     return {
         "settings_path": result.settings_path,
@@ -1002,13 +1240,6 @@ def sweep_result_to_json_dict(result: SweepResult) -> dict[str, Any]:
         "duration": result.duration,
         "dt": result.dt,
         "scenario_count": result.scenario_count,
-        "top_scenarios": [
-            {
-                **asdict(scenario),
-                "left_profile": asdict(scenario.left_profile),
-                "right_profile": asdict(scenario.right_profile),
-            }
-            for scenario in result.top_scenarios
-        ],
+        "top_scenarios": [_scenario_to_dict(scenario) for scenario in result.top_scenarios],
         "recommendations": list(result.recommendations),
     }
@@ -1,8 +1,40 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+import itertools
 import math
 import random
+import sys
+
+from .spatial_hash import SpatialHashGrid
+
+
+__all__ = [
+    "BROADPHASE_MIN_BODIES",
+    "MAX_FRAME_DT",
+    "CollisionSettings",
+    "DamageSettings",
+    "FrictionSettings",
+    "HealingSettings",
+    "ImpactSettings",
+    "LaunchSettings",
+    "PhysicsBasics",
+    "PhysicsBody",
+    "PhysicsTuning",
+    "PhysicsWorld",
+    "Projectile",
+    "RangedAttackSettings",
+    "RecoilSettings",
+    "SolverSettings",
+    "StaggerSettings",
+    "create_clash_world",
+    "create_duel_world",
+]
+
+# 이 수 이상의 바디가 있을 때만 격자 broadphase 사용 (그 미만은 전수 검사가 더 빠름)
+BROADPHASE_MIN_BODIES = 32
+# advance()에 넘길 수 있는 프레임 시간 상한 (큰 프레임 지연 시 폭주 방지)
+MAX_FRAME_DT = 1.0 / 30.0
 
 
 @dataclass(slots=True)
@@ -63,6 +95,8 @@ class PhysicsBody:
             self.hp = self.max_hp
         if self.ghost_hp < 0:
             self.ghost_hp = self.hp
+        # 팀은 한 번만 정규화/intern 해 두고, 충돌/무적 판정은 저장된 값을 그대로 비교한다
+        self.team = sys.intern(str(self.team).strip().lower())
         self.role = self._normalize_role(self.role)
 
     @property
@@ -75,7 +109,7 @@ class PhysicsBody:
         allowed = {"tank", "dealer", "healer", "ranged_dealer", "ranged_healer"}
         if role not in allowed:
             return "dealer"
-        return role
+        return sys.intern(role)
 
 
 @dataclass(slots=True)
@@ -480,10 +514,27 @@ class PhysicsWorld:
     time_elapsed: float = 0.0
     total_collisions: int = 0
     last_step_collisions: int = 0
-    active_contacts: set[tuple[int, int]] = field(default_factory=set)
+    # 접촉 중인 쌍의 키: (작은 id << 32) | 큰 id  (contact_pair()로 풀 수 있음)
+    active_contacts: set[int] = field(default_factory=set)
+    # 마지막 step 동안 겹친 모든 쌍 (이전 step부터 이어진 접촉 포함, 쌍마다 처음 겹친 pass 기준 1회)
+    # : (a_id, b_id, penetration, nx, ny), 법선은 a -> b
+    contacts: list[tuple[int, int, float, float, float]] = field(default_factory=list)
     invincible_teams: set[str] = field(default_factory=set)
     projectiles: list[Projectile] = field(default_factory=list)
     next_proj_id: int = 0
+    _broadphase: SpatialHashGrid = field(
+        default_factory=SpatialHashGrid,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    # (team, allies) -> 해당 팀(또는 상대) 바디 목록, step 시작마다 비운다
+    _team_rosters: dict[tuple[str, bool], list[PhysicsBody]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
     def __post_init__(self) -> None:
         if self.width <= 0 or self.height <= 0:
@@ -500,52 +551,96 @@ class PhysicsWorld:
         for team in teams:
             team_name = str(team).strip().lower()
             if team_name:
-                normalized.add(team_name)
+                normalized.add(sys.intern(team_name))
         self.invincible_teams = normalized
 
     def is_team_invincible(self, team: str) -> bool:
         return team.strip().lower() in self.invincible_teams
 
+    @staticmethod
+    def contact_pair(key: int) -> tuple[int, int]:
+        """active_contacts의 키를 (작은 body_id, 큰 body_id)로 변환"""
+        return key >> 32, key & 0xFFFFFFFF
+
     def add_random_impulse(self, *, magnitude: float = 420.0, seed: int | None = None) -> None:
         if magnitude <= 0:
             raise ValueError("magnitude must be > 0")
-        rng = random.Random(seed)
+        # 바디마다 (vx, vy) 순서로 뽑으므로 같은 seed면 이전과 같은 임펄스
+        uniform = random.Random(seed).uniform
+        low = -magnitude
         for body in self.bodies:
-            if not body.is_alive:
+            if body.hp <= 0:
                 continue
-            body.vx += rng.uniform(-magnitude, magnitude) / body.mass
-            body.vy += rng.uniform(-magnitude, magnitude) / body.mass
+            mass = body.mass
+            body.vx += uniform(low, magnitude) / mass
+            body.vy += uniform(low, magnitude) / mass
 
     def max_speed(self) -> float:
-        alive = [body for body in self.bodies if body.is_alive]
-        if not alive:
-            return 0.0
-        return max(math.hypot(body.vx, body.vy) for body in alive)
+        # 제곱 속도로 최댓값만 고른 뒤 sqrt는 한 번만
+        peak_sq = 0.0
+        for body in self.bodies:
+            if body.hp <= 0:
+                continue
+            speed_sq = body.vx * body.vx + body.vy * body.vy
+            if speed_sq > peak_sq:
+                peak_sq = speed_sq
+        return math.sqrt(peak_sq)
+
+    def advance(self, frame_dt: float, num_substeps: int = 1) -> None:
+        """가변 프레임 시간을 num_substeps개의 고정 서브스텝으로 나누어 진행"""
+        if frame_dt <= 0:
+            raise ValueError("frame_dt must be > 0")
+        if num_substeps <= 0:
+            raise ValueError("num_substeps must be > 0")
+        h = min(frame_dt, MAX_FRAME_DT) / num_substeps
+        step = self.step
+        for _ in range(num_substeps):
+            step(h)
 
     def step(self, dt: float) -> None:
         if dt <= 0:
             raise ValueError("dt must be > 0")
 
-        damping = max(0.0, 1.0 - (self.tuning.linear_damping * dt))
+        # 루프 안에서 반복해서 읽는 튜닝 값은 로컬로 묶어 둔다
+        tuning = self.tuning
+        gravity = tuning.gravity
+        linear_damping = tuning.linear_damping
+        ground_friction = tuning.ground_friction
+        stagger_drive_multiplier = tuning.stagger_drive_multiplier
+        damping = max(0.0, 1.0 - (linear_damping * dt))
+        dead_damping = max(0.0, 1.0 - (linear_damping * 2.0 * dt))
+        ground_damping = max(0.0, 1.0 - (ground_friction * dt))
+        # 벽/바닥 반사 계수도 바디마다가 아니라 step당 한 번만 계산
+        wall_restitution = tuning.wall_restitution
+        wall_damping = max(0.0, 1.0 - tuning.wall_friction)
+        floor_damping = max(0.0, 1.0 - ground_friction)
+        ground_snap_speed = tuning.ground_snap_speed
+        self._team_rosters.clear()
 
         for body in self.bodies:
             body.last_damage = 0.0
-            if not body.is_alive:
+            if body.hp <= 0:
                 body.stagger_timer = 0.0
                 body.ability_cooldown = 0.0
                 if body.hit_flash_timer > 0:
                     body.hit_flash_timer = max(0.0, body.hit_flash_timer - dt)
                 ground_y = self.height - body.radius
                 if body.y < ground_y - 1e-6:
-                    body.vy += self.tuning.gravity * dt
-                    body.vx *= max(0.0, 1.0 - (self.tuning.linear_damping * 2.0 * dt))
+                    body.vy += gravity * dt
+                    body.vx *= dead_damping
                     body.x += body.vx * dt
                     body.y += body.vy * dt
                     if body.y >= ground_y:
                         body.y = ground_y
                         body.vy = 0.0
                         body.vx = 0.0
-                    self._resolve_wall_collision(body)
+                    self._resolve_wall_collision(
+                        body,
+                        wall_restitution,
+                        wall_damping,
+                        floor_damping,
+                        ground_snap_speed,
+                    )
                 else:
                     body.vx = 0.0
                     body.vy = 0.0
@@ -564,53 +659,80 @@ class PhysicsWorld:
                 body.ghost_hp = body.hp
 
             on_ground = self._is_grounded(body)
+            # 사망 바디는 위에서 continue 했으므로 구동력은 생존 바디만 계산된다
             drive_force = 0.0
-            if body.is_alive:
-                should_stop = False
-                if body.role == "ranged_dealer":
-                    target = self._closest_enemy(body, self._ranged_effective_range(body))
-                    if target is not None:
-                        should_stop = True
-                elif body.role == "healer":
-                    support_target = self._frontline_ally(
-                        body,
-                        self._healer_effective_range(body),
-                        require_missing_hp=False,
-                    )
-                    if support_target is not None:
-                        should_stop = True
+            should_stop = False
+            if body.role == "ranged_dealer":
+                target = self._closest_enemy(body, self._ranged_effective_range(body))
+                if target is not None:
+                    should_stop = True
+            elif body.role == "healer":
+                support_target = self._frontline_ally(
+                    body,
+                    self._healer_effective_range(body),
+                    require_missing_hp=False,
+                )
+                if support_target is not None:
+                    should_stop = True
 
-                if not should_stop:
-                    drive_force = self._effective_drive_force(body)
-                    if body.role == "healer":
-                        drive_force *= 0.55
-                    if body.stagger_timer > 0:
-                        drive_force *= self.tuning.stagger_drive_multiplier
+            if not should_stop:
+                drive_force = self._effective_drive_force(body)
+                if body.role == "healer":
+                    drive_force *= 0.55
+                if body.stagger_timer > 0:
+                    drive_force *= stagger_drive_multiplier
 
+            # 가속 -> 감쇠 -> (지면 마찰) -> 위치 적분을 로컬 값으로 한 번에 처리
             ax = (body.forward_dir * drive_force) / body.mass
-            ay = self.tuning.gravity
-            if on_ground and body.vy >= 0:
+            ay = gravity
+            vx = body.vx
+            vy = body.vy
+            if on_ground and vy >= 0:
                 ay = 0.0
-                body.vy = 0.0
-
-            body.vx += ax * dt
-            body.vy += ay * dt
-            body.vx *= damping
-            body.vy *= damping
+                vy = 0.0
 
+            vx = (vx + ax * dt) * damping
+            vy = (vy + ay * dt) * damping
             if on_ground:
-                body.vx *= max(0.0, 1.0 - (self.tuning.ground_friction * dt))
-
-            body.x += body.vx * dt
-            body.y += body.vy * dt
-
-            self._resolve_wall_collision(body)
+                vx *= ground_damping
+
+            body.vx = vx
+            body.vy = vy
+            body.x += vx * dt
+            body.y += vy * dt
+
+            self._resolve_wall_collision(
+                body,
+                wall_restitution,
+                wall_damping,
+                floor_damping,
+                ground_snap_speed,
+            )
 
         collision_count = 0
-        current_contacts: set[tuple[int, int]] = set()
-        impact_pairs: set[tuple[int, int]] = set()
-        for _ in range(self.tuning.solver_passes):
-            collision_count += self._resolve_body_collisions(current_contacts, impact_pairs)
+        current_contacts: set[int] = set()
+        self.contacts.clear()
+        impact_pairs: set[int] = set()
+        # 후보 쌍은 적분 직후 한 번만 구해 모든 solver pass가 공유한다
+        # (pass 도중 위치 보정으로 새로 겹친 쌍은 다음 step에서 잡힌다)
+        if len(self.bodies) >= BROADPHASE_MIN_BODIES:
+            pairs = self._broadphase_pairs()
+        else:
+            pairs = list(itertools.combinations(range(len(self.bodies)), 2))
+        if pairs:
+            # 질량은 step 중 바뀌지 않으므로 역질량은 pass마다가 아니라 step당 한 번 계산
+            inv_masses = [1.0 / body.mass for body in self.bodies]
+            for _ in range(tuning.solver_passes):
+                pass_collisions = self._resolve_body_collisions(
+                    pairs,
+                    inv_masses,
+                    current_contacts,
+                    impact_pairs,
+                )
+                # 겹친 쌍이 없던 pass는 아무것도 바꾸지 않으므로 이후 pass도 결과가 같다
+                if pass_collisions == 0:
+                    break
+                collision_count += pass_collisions
 
         self._apply_role_actions()
         self._update_projectiles(dt)
@@ -624,10 +746,16 @@ class PhysicsWorld:
         ground_y = self.height - body.radius
         return body.y >= (ground_y - 1e-6) and abs(body.vy) <= self.tuning.ground_snap_speed
 
-    def _resolve_wall_collision(self, body: PhysicsBody) -> None:
+    def _resolve_wall_collision(
+        self,
+        body: PhysicsBody,
+        wr: float,
+        wf: float,
+        floor_damping: float,
+        ground_snap_speed: float,
+    ) -> None:
+        """wr: 벽 반발 계수, wf/floor_damping: 벽/바닥 접촉 시 속도 유지 비율"""
         r = body.radius
-        wr = self.tuning.wall_restitution
-        wf = max(0.0, 1.0 - self.tuning.wall_friction)
 
         if body.x - r < 0:
             body.x = r
@@ -647,118 +775,152 @@ class PhysicsWorld:
                 body.vx *= wf
         elif body.y + r > self.height:
             body.y = self.height - r
-            if body.vy > self.tuning.ground_snap_speed:
+            if body.vy > ground_snap_speed:
                 body.vy = -body.vy * wr
             else:
                 body.vy = 0.0
-            body.vx *= max(0.0, 1.0 - self.tuning.ground_friction)
+            body.vx *= floor_damping
 
     def _resolve_body_collisions(
         self,
-        current_contacts: set[tuple[int, int]],
-        impact_pairs: set[tuple[int, int]],
+        pairs: list[tuple[int, int]],
+        inv_masses: list[float],
+        current_contacts: set[int],
+        impact_pairs: set[int],
     ) -> int:
         collisions = 0
-        count = len(self.bodies)
-
-        for i in range(count):
-            a = self.bodies[i]
-            if not a.is_alive:
+        bodies = self.bodies
+        tuning = self.tuning
+        position_correction = tuning.position_correction
+        restitution = tuning.restitution
+        collision_boost = tuning.collision_boost
+        friction = tuning.friction
+        # 이전 step 접촉 집합과 이번 step 접촉 기록도 pair 루프 밖에서 로컬로 묶는다
+        active_contacts = self.active_contacts
+        record_contact = self.contacts.append
+        for i, j in pairs:
+            a = bodies[i]
+            if a.hp <= 0:
                 continue
-            for j in range(i + 1, count):
-                b = self.bodies[j]
-                if not b.is_alive:
-                    continue
-                if a.team == b.team:
-                    continue
-                dx = b.x - a.x
-                dy = b.y - a.y
-                radii = a.radius + b.radius
-                distance_sq = dx * dx + dy * dy
-                if distance_sq >= radii * radii:
-                    continue
+            b = bodies[j]
+            if b.hp <= 0:
+                continue
+            if a.team == b.team:
+                continue
+            dx = b.x - a.x
+            dy = b.y - a.y
+            radii = a.radius + b.radius
+            distance_sq = dx * dx + dy * dy
+            if distance_sq >= radii * radii:
+                continue
+
+            # 튜플 대신 정수 하나로 쌍을 표현해 할당/해시 비용을 줄인다
+            a_id = a.body_id
+            b_id = b.body_id
+            pair = (a_id << 32) | b_id if a_id < b_id else (b_id << 32) | a_id
+
+            if distance_sq <= 1e-12:
+                nx = 1.0 if (a_id + b_id) % 2 == 0 else -1.0
+                ny = 0.0
+                distance = radii
+            else:
+                distance = math.sqrt(distance_sq)
+                nx = dx / distance
+                ny = dy / distance
 
-                pair = (min(a.body_id, b.body_id), max(a.body_id, b.body_id))
+            if pair not in current_contacts:
                 current_contacts.add(pair)
+                record_contact((a_id, b_id, radii - distance, nx, ny))
+
+            inv_mass_a = inv_masses[i]
+            inv_mass_b = inv_masses[j]
+            inv_mass_sum = inv_mass_a + inv_mass_b
+
+            penetration = radii - distance
+            correction = (penetration / inv_mass_sum) * position_correction
+            a.x -= nx * correction * inv_mass_a
+            a.y -= ny * correction * inv_mass_a
+            b.x += nx * correction * inv_mass_b
+            b.y += ny * correction * inv_mass_b
+
+            rel_vx = b.vx - a.vx
+            rel_vy = b.vy - a.vy
+            rel_normal_speed = (rel_vx * nx) + (rel_vy * ny)
+
+            if rel_normal_speed < 0:
+                power_a = max(1e-6, a.power)
+                power_b = max(1e-6, b.power)
+                effective_inv_mass_a = inv_mass_a / power_a
+                effective_inv_mass_b = inv_mass_b / power_b
+                effective_inv_mass_sum = effective_inv_mass_a + effective_inv_mass_b
+
+                impulse = -(1.0 + restitution) * rel_normal_speed
+                impulse /= effective_inv_mass_sum
+                impulse *= collision_boost
+
+                impulse_x = impulse * nx
+                impulse_y = impulse * ny
+                a.vx -= impulse_x * effective_inv_mass_a
+                a.vy -= impulse_y * effective_inv_mass_a
+                b.vx += impulse_x * effective_inv_mass_b
+                b.vy += impulse_y * effective_inv_mass_b
+
+                tangent_x = rel_vx - (rel_normal_speed * nx)
+                tangent_y = rel_vy - (rel_normal_speed * ny)
+                tangent_sq = (tangent_x * tangent_x) + (tangent_y * tangent_y)
+                if tangent_sq > 1e-18:
+                    inv_tangent = 1.0 / math.sqrt(tangent_sq)
+                    tangent_x *= inv_tangent
+                    tangent_y *= inv_tangent
+                    friction_impulse = -((rel_vx * tangent_x) + (rel_vy * tangent_y))
+                    friction_impulse /= effective_inv_mass_sum
+                    friction_limit = abs(impulse) * friction
+                    friction_impulse = max(-friction_limit, min(friction_impulse, friction_limit))
+
+                    fx = friction_impulse * tangent_x
+                    fy = friction_impulse * tangent_y
+                    a.vx -= fx * effective_inv_mass_a
+                    a.vy -= fy * effective_inv_mass_a
+                    b.vx += fx * effective_inv_mass_b
+                    b.vy += fy * effective_inv_mass_b
 
-                if distance_sq <= 1e-12:
-                    nx = 1.0 if (a.body_id + b.body_id) % 2 == 0 else -1.0
-                    ny = 0.0
-                    distance = radii
-                else:
-                    distance = math.sqrt(distance_sq)
-                    nx = dx / distance
-                    ny = dy / distance
-
-                inv_mass_a = 1.0 / a.mass
-                inv_mass_b = 1.0 / b.mass
-                inv_mass_sum = inv_mass_a + inv_mass_b
-
-                penetration = radii - distance
-                correction = (penetration / inv_mass_sum) * self.tuning.position_correction
-                a.x -= nx * correction * inv_mass_a
-                a.y -= ny * correction * inv_mass_a
-                b.x += nx * correction * inv_mass_b
-                b.y += ny * correction * inv_mass_b
-
-                rel_vx = b.vx - a.vx
-                rel_vy = b.vy - a.vy
-                rel_normal_speed = (rel_vx * nx) + (rel_vy * ny)
-
-                if rel_normal_speed < 0:
-                    power_a = max(1e-6, a.power)
-                    power_b = max(1e-6, b.power)
-                    effective_inv_mass_a = inv_mass_a / power_a
-                    effective_inv_mass_b = inv_mass_b / power_b
-                    effective_inv_mass_sum = effective_inv_mass_a + effective_inv_mass_b
-
-                    impulse = -(1.0 + self.tuning.restitution) * rel_normal_speed
-                    impulse /= effective_inv_mass_sum
-                    impulse *= self.tuning.collision_boost
-
-                    impulse_x = impulse * nx
-                    impulse_y = impulse * ny
-                    a.vx -= impulse_x * effective_inv_mass_a
-                    a.vy -= impulse_y * effective_inv_mass_a
-                    b.vx += impulse_x * effective_inv_mass_b
-                    b.vy += impulse_y * effective_inv_mass_b
-
-                    tangent_x = rel_vx - (rel_normal_speed * nx)
-                    tangent_y = rel_vy - (rel_normal_speed * ny)
-                    tangent_mag = math.hypot(tangent_x, tangent_y)
-                    if tangent_mag > 1e-9:
-                        tangent_x /= tangent_mag
-                        tangent_y /= tangent_mag
-                        friction_impulse = -((rel_vx * tangent_x) + (rel_vy * tangent_y))
-                        friction_impulse /= effective_inv_mass_sum
-                        friction_limit = abs(impulse) * self.tuning.friction
-                        friction_impulse = max(-friction_limit, min(friction_impulse, friction_limit))
-
-                        fx = friction_impulse * tangent_x
-                        fy = friction_impulse * tangent_y
-                        a.vx -= fx * effective_inv_mass_a
-                        a.vy -= fy * effective_inv_mass_a
-                        b.vx += fx * effective_inv_mass_b
-                        b.vy += fy * effective_inv_mass_b
-
-                if (
-                    pair not in self.active_contacts
-                    and pair not in impact_pairs
-                    and rel_normal_speed < 0
-                ):
-                    self._apply_impact_effects(a, b, nx)
-                    impact_pairs.add(pair)
-
-                collisions += 1
+            if (
+                pair not in active_contacts
+                and pair not in impact_pairs
+                and rel_normal_speed < 0
+            ):
+                self._apply_impact_effects(a, b, nx)
+                impact_pairs.add(pair)
+
+            collisions += 1
 
         return collisions
 
-    def _incoming_strength(self, attacker: PhysicsBody, defender: PhysicsBody) -> float:
-        power_ratio = max(1e-6, attacker.power) / max(1e-6, defender.power)
-        mass_ratio = attacker.mass / max(1e-6, defender.mass)
-        scaled = self.tuning.mass_power_impact_scale * mass_ratio
-        scaled *= power_ratio ** self.tuning.power_ratio_exponent
-        return min(self.tuning.impact_speed_cap, scaled)
+    def _broadphase_pairs(self) -> list[tuple[int, int]]:
+        alive = [(idx, body) for idx, body in enumerate(self.bodies) if body.hp > 0]
+        grid = self._broadphase
+        grid.clear()
+        if not alive:
+            return []
+        mean_radius = sum(body.radius for _, body in alive) / len(alive)
+        grid.cell_size = max(1.0, 2.0 * mean_radius)
+        for idx, body in alive:
+            grid.insert(idx, body.x, body.y, body.radius)
+        return grid.candidate_pairs()
+
+    def _incoming_strengths(self, a: PhysicsBody, b: PhysicsBody) -> tuple[float, float]:
+        """(a가 받는 충격, b가 받는 충격) - 클램프한 power/mass를 양쪽이 공유"""
+        tuning = self.tuning
+        power_a = max(1e-6, a.power)
+        power_b = max(1e-6, b.power)
+        mass_a = max(1e-6, a.mass)
+        mass_b = max(1e-6, b.mass)
+        scale = tuning.mass_power_impact_scale
+        exponent = tuning.power_ratio_exponent
+        cap = tuning.impact_speed_cap
+        incoming_a = scale * (b.mass / mass_a) * (power_b / power_a) ** exponent
+        incoming_b = scale * (a.mass / mass_b) * (power_a / power_b) ** exponent
+        return min(cap, incoming_a), min(cap, incoming_b)
 
     def _apply_impact_effects(
         self,
@@ -766,41 +928,41 @@ class PhysicsWorld:
         b: PhysicsBody,
         nx: float,
     ) -> None:
-        incoming_a = self._incoming_strength(b, a)
-        incoming_b = self._incoming_strength(a, b)
-
-        recoil_a = self.tuning.min_recoil_speed + (incoming_a * self.tuning.recoil_scale)
-        recoil_b = self.tuning.min_recoil_speed + (incoming_b * self.tuning.recoil_scale)
-
+        incoming_a, incoming_b = self._incoming_strengths(a, b)
+        tuning = self.tuning
+
+        min_recoil_speed = tuning.min_recoil_speed
+        recoil_scale = tuning.recoil_scale
+        a.vx -= nx * ((min_recoil_speed + (incoming_a * recoil_scale)) / a.mass)
+        b.vx += nx * ((min_recoil_speed + (incoming_b * recoil_scale)) / b.mass)
+
+        max_launch_speed = tuning.max_launch_speed
+        min_launch_speed = tuning.min_launch_speed
+        launch_scale = tuning.launch_scale
+        launch_height_scale = tuning.launch_height_scale
         launch_a = min(
-            self.tuning.max_launch_speed,
-            (
-                self.tuning.min_launch_speed + (incoming_a * self.tuning.launch_scale)
-            )
-            * self.tuning.launch_height_scale,
+            max_launch_speed,
+            (min_launch_speed + (incoming_a * launch_scale)) * launch_height_scale,
         )
         launch_b = min(
-            self.tuning.max_launch_speed,
-            (
-                self.tuning.min_launch_speed + (incoming_b * self.tuning.launch_scale)
-            )
-            * self.tuning.launch_height_scale,
+            max_launch_speed,
+            (min_launch_speed + (incoming_b * launch_scale)) * launch_height_scale,
         )
-
-        a.vx -= nx * (recoil_a / a.mass)
-        b.vx += nx * (recoil_b / b.mass)
         a.vy -= launch_a / a.mass
         b.vy -= launch_b / b.mass
 
-        damage_a = self.tuning.damage_base + (incoming_a * self.tuning.damage_scale)
-        damage_b = self.tuning.damage_base + (incoming_b * self.tuning.damage_scale)
-        if self.is_team_invincible(a.team):
+        damage_base = tuning.damage_base
+        damage_scale = tuning.damage_scale
+        invincible_teams = self.invincible_teams
+        if a.team in invincible_teams:
             damage_a = 0.0
         else:
+            damage_a = damage_base + (incoming_a * damage_scale)
             a.hp = max(0.0, a.hp - damage_a)
-        if self.is_team_invincible(b.team):
+        if b.team in invincible_teams:
             damage_b = 0.0
         else:
+            damage_b = damage_base + (incoming_b * damage_scale)
             b.hp = max(0.0, b.hp - damage_b)
         a.last_damage = damage_a
         b.last_damage = damage_b
@@ -809,22 +971,33 @@ class PhysicsWorld:
         if damage_b > 0:
             b.hit_flash_timer = 0.15
 
-        stagger_a = min(
-            self.tuning.max_stagger,
-            self.tuning.stagger_base + (incoming_a * self.tuning.stagger_scale),
-        )
-        stagger_b = min(
-            self.tuning.max_stagger,
-            self.tuning.stagger_base + (incoming_b * self.tuning.stagger_scale),
-        )
-        a.stagger_timer = max(a.stagger_timer, stagger_a)
-        b.stagger_timer = max(b.stagger_timer, stagger_b)
+        max_stagger = tuning.max_stagger
+        stagger_base = tuning.stagger_base
+        stagger_scale = tuning.stagger_scale
+        stagger_a = min(max_stagger, stagger_base + (incoming_a * stagger_scale))
+        stagger_b = min(max_stagger, stagger_base + (incoming_b * stagger_scale))
+        if stagger_a > a.stagger_timer:
+            a.stagger_timer = stagger_a
+        if stagger_b > b.stagger_timer:
+            b.stagger_timer = stagger_b
+
+    def _team_roster(self, team: str, *, allies: bool) -> list[PhysicsBody]:
+        """allies=True면 team 소속, False면 그 외 바디 (self.bodies 순서 유지, step 동안 재사용)"""
+        key = (team, allies)
+        roster = self._team_rosters.get(key)
+        if roster is None:
+            if allies:
+                roster = [body for body in self.bodies if body.team == team]
+            else:
+                roster = [body for body in self.bodies if body.team != team]
+            self._team_rosters[key] = roster
+        return roster
 
     def _closest_enemy(self, actor: PhysicsBody, max_range: float) -> PhysicsBody | None:
         closest: PhysicsBody | None = None
         closest_dist_sq = max_range * max_range
-        for other in self.bodies:
-            if not other.is_alive or other.team == actor.team:
+        for other in self._team_roster(actor.team, allies=False):
+            if other.hp <= 0:
                 continue
             dx = other.x - actor.x
             dy = other.y - actor.y
@@ -1016,8 +1189,8 @@ class PhysicsWorld:
         best_front_score = -float("inf")
         best_hp_ratio = float("inf")
         best_dist_sq = float("inf")
-        for other in self.bodies:
-            if not other.is_alive or other.team != actor.team:
+        for other in self._team_roster(actor.team, allies=True):
+            if other.hp <= 0:
                 continue
             if other.body_id == actor.body_id:
                 continue
@@ -1056,10 +1229,10 @@ class PhysicsWorld:
         weakest: PhysicsBody | None = None
         weakest_ratio = 1.1
         max_range_sq = max_range * max_range
-        for other in self.bodies:
+        for other in self._team_roster(actor.team, allies=True):
             if other is actor:
                 continue
-            if not other.is_alive or other.team != actor.team:
+            if other.hp <= 0:
                 continue
             dx = other.x - actor.x
             dy = other.y - actor.y
@@ -1081,17 +1254,18 @@ class PhysicsWorld:
         force: float,
         damage: float,
     ) -> None:
-        if not target.is_alive:
+        if target.hp <= 0:
             return
         dx = target.x - actor.x
         dy = target.y - actor.y
-        distance = math.hypot(dx, dy)
-        if distance <= 1e-9:
+        distance_sq = (dx * dx) + (dy * dy)
+        if distance_sq <= 1e-18:
             nx = actor.forward_dir if abs(actor.forward_dir) > 1e-6 else 1.0
             ny = 0.0
         else:
-            nx = dx / distance
-            ny = dy / distance
+            inv_distance = 1.0 / math.sqrt(distance_sq)
+            nx = dx * inv_distance
+            ny = dy * inv_distance
 
         effective_force = self._ranged_effective_force(actor, force)
         target.vx += nx * (effective_force / max(1e-6, target.mass))
@@ -1101,7 +1275,7 @@ class PhysicsWorld:
             min(self.tuning.max_stagger, self.tuning.stagger_base + 0.12),
         )
 
-        if damage > 0 and not self.is_team_invincible(target.team):
+        if damage > 0 and target.team not in self.invincible_teams:
             scaled_damage = self._ranged_effective_damage(actor, damage)
             target.hp = max(0.0, target.hp - scaled_damage)
             target.last_damage = max(target.last_damage, scaled_damage)
@@ -1117,13 +1291,14 @@ class PhysicsWorld:
     ) -> None:
         dx = target.x - actor.x
         dy = target.y - actor.y
-        dist = math.hypot(dx, dy)
-        if dist < 1e-9:
+        dist_sq = (dx * dx) + (dy * dy)
+        if dist_sq < 1e-18:
             nx = actor.forward_dir if abs(actor.forward_dir) > 1e-6 else 1.0
             ny = 0.0
         else:
-            nx = dx / dist
-            ny = dy / dist
+            inv_dist = 1.0 / math.sqrt(dist_sq)
+            nx = dx * inv_dist
+            ny = dy * inv_dist
 
         proj_radius = self._effective_projectile_radius(actor)
         spawn_dist = actor.radius + proj_radius + 1.0
@@ -1150,10 +1325,21 @@ class PhysicsWorld:
             if not proj.active:
                 continue
 
-            proj.x += proj.vx * dt
-            proj.y += proj.vy * dt
+            start_x = proj.x
+            start_y = proj.y
+            seg_x = proj.vx * dt
+            seg_y = proj.vy * dt
+            proj.x += seg_x
+            proj.y += seg_y
             proj.age += dt
 
+            # 만료/이탈 판정보다 먼저 이동 구간을 검사해야 벽 근처 적도 통과하지 않는다
+            enemies = self._team_roster(proj.team, allies=False)
+            hit_body = self._sweep_projectile(proj, start_x, start_y, seg_x, seg_y, enemies)
+            if hit_body is not None:
+                self._apply_projectile_hit(proj, hit_body)
+                continue
+
             if proj.age >= proj.lifetime:
                 continue
 
@@ -1165,38 +1351,59 @@ class PhysicsWorld:
             ):
                 continue
 
-            hit_body: PhysicsBody | None = None
-            hit_dist_sq = float("inf")
-            for body in self.bodies:
-                if not body.is_alive:
-                    continue
-                if body.team == proj.team:
-                    continue
-                dx = body.x - proj.x
-                dy = body.y - proj.y
-                dist_sq = dx * dx + dy * dy
-                contact_dist = body.radius + proj.radius
-                if dist_sq <= contact_dist * contact_dist and dist_sq < hit_dist_sq:
-                    hit_body = body
-                    hit_dist_sq = dist_sq
-
-            if hit_body is not None:
-                self._apply_projectile_hit(proj, hit_body)
-                continue
-
             remaining.append(proj)
 
         self.projectiles = remaining
 
+    @staticmethod
+    def _sweep_projectile(
+        proj: Projectile,
+        start_x: float,
+        start_y: float,
+        seg_x: float,
+        seg_y: float,
+        enemies: list[PhysicsBody],
+    ) -> PhysicsBody | None:
+        """이번 스텝 이동 구간(선분)과 원의 교차로 가장 먼저 맞는 적을 찾는다 (터널링 방지)"""
+        seg_len_sq = seg_x * seg_x + seg_y * seg_y
+        pr = proj.radius
+        hit_body: PhysicsBody | None = None
+        hit_t = float("inf")
+        for body in enemies:
+            if body.hp <= 0:
+                continue
+            fx = start_x - body.x
+            fy = start_y - body.y
+            contact_dist = body.radius + pr
+            c = fx * fx + fy * fy - contact_dist * contact_dist
+            if c <= 0:
+                t = 0.0
+            else:
+                # |f + t*seg|^2 = R^2 의 작은 근 (b는 절반 계수)
+                b = fx * seg_x + fy * seg_y
+                if b >= 0 or seg_len_sq <= 1e-18:
+                    continue
+                disc = b * b - seg_len_sq * c
+                if disc < 0:
+                    continue
+                t = (-b - math.sqrt(disc)) / seg_len_sq
+                if t > 1.0:
+                    continue
+            if t < hit_t:
+                hit_body = body
+                hit_t = t
+        return hit_body
+
     def _apply_projectile_hit(self, proj: Projectile, target: PhysicsBody) -> None:
-        if not target.is_alive:
+        if target.hp <= 0:
             return
 
-        speed = math.hypot(proj.vx, proj.vy)
-        if speed < 1e-9:
+        speed_sq = (proj.vx * proj.vx) + (proj.vy * proj.vy)
+        if speed_sq < 1e-18:
             nx, ny = 1.0, 0.0
         else:
-            nx, ny = proj.vx / speed, proj.vy / speed
+            inv_speed = 1.0 / math.sqrt(speed_sq)
+            nx, ny = proj.vx * inv_speed, proj.vy * inv_speed
 
         force = proj.knockback_force
         target.vx += nx * (force / max(1e-6, target.mass))
@@ -1207,13 +1414,13 @@ class PhysicsWorld:
         )
 
         target.hit_flash_timer = 0.15
-        if proj.damage > 0 and not self.is_team_invincible(target.team):
+        if proj.damage > 0 and target.team not in self.invincible_teams:
             target.hp = max(0.0, target.hp - proj.damage)
             target.last_damage = max(target.last_damage, proj.damage)
 
     def _apply_role_actions(self) -> None:
         for actor in self.bodies:
-            if not actor.is_alive:
+            if actor.hp <= 0:
                 continue
             if actor.ability_cooldown > 0:
                 continue
@@ -1316,6 +1523,13 @@ def create_duel_world(
     right_spacing = right_radius * 2.3
     left_start_x = side_margin + left_radius
     right_start_x = width - side_margin - right_radius
+    # 팀별로 모든 공이 공유하는 값은 루프 밖에서 한 번만 계산
+    left_vx = abs(left_initial_speed)
+    right_vx = -abs(right_initial_speed)
+    left_speed = max(1.0, left_vx)
+    right_speed = max(1.0, -right_vx)
+    left_max_hp, left_start_hp = max(1.0, left_hp), max(0.0, left_hp)
+    right_max_hp, right_start_hp = max(1.0, right_hp), max(0.0, right_hp)
 
     bodies: list[PhysicsBody] = []
     for idx in range(balls_per_side):
@@ -1331,16 +1545,16 @@ def create_duel_world(
                 team="left",
                 x=left_x,
                 y=height - left_radius,
-                vx=abs(left_initial_speed),
+                vx=left_vx,
                 vy=0.0,
                 radius=left_radius,
                 mass=left_mass,
                 color="#4aa3ff",
                 power=left_power,
                 forward_dir=1.0,
-                max_hp=max(1.0, left_hp),
-                hp=max(0.0, left_hp),
-                speed=max(1.0, abs(left_initial_speed)),
+                max_hp=left_max_hp,
+                hp=left_start_hp,
+                speed=left_speed,
                 base_cooldown=0.0,
             )
         )
@@ -1350,16 +1564,16 @@ def create_duel_world(
                 team="right",
                 x=right_x,
                 y=height - right_radius,
-                vx=-abs(right_initial_speed),
+                vx=right_vx,
                 vy=0.0,
                 radius=right_radius,
                 mass=right_mass,
                 color="#f26b5e",
                 power=right_power,
                 forward_dir=-1.0,
-                max_hp=max(1.0, right_hp),
-                hp=max(0.0, right_hp),
-                speed=max(1.0, abs(right_initial_speed)),
+                max_hp=right_max_hp,
+                hp=right_start_hp,
+                speed=right_speed,
                 base_cooldown=0.0,
             )
         )
@@ -1459,21 +1673,27 @@ def _spawn_team(
     rows = max(1, min(6, math.ceil(math.sqrt(count))))
     spacing = radius * 2.4
     spawned: list[PhysicsBody] = []
+    # 루프 불변값은 미리 계산 (난수 호출 순서는 그대로 유지)
+    uniform = rng.uniform
+    pos_jitter = radius * 0.15
+    row_center = (rows - 1) * 0.5
+    max_x = world_width - radius
+    max_y = world_height - radius
 
     for idx in range(count):
         row = idx % rows
         col = idx // rows
 
         x = anchor_x - (col * spacing * toward_center)
-        y = anchor_y + ((row - (rows - 1) * 0.5) * spacing)
+        y = anchor_y + ((row - row_center) * spacing)
 
-        x += rng.uniform(-radius * 0.15, radius * 0.15)
-        y += rng.uniform(-radius * 0.15, radius * 0.15)
-        x = min(world_width - radius, max(radius, x))
-        y = min(world_height - radius, max(radius, y))
+        x += uniform(-pos_jitter, pos_jitter)
+        y += uniform(-pos_jitter, pos_jitter)
+        x = min(max_x, max(radius, x))
+        y = min(max_y, max(radius, y))
 
-        vx = toward_center * (95.0 + rng.uniform(-spawn_jitter, spawn_jitter) * 0.35)
-        vy = rng.uniform(-spawn_jitter, spawn_jitter) * 0.22
+        vx = toward_center * (95.0 + uniform(-spawn_jitter, spawn_jitter) * 0.35)
+        vy = uniform(-spawn_jitter, spawn_jitter) * 0.22
 
         spawned.append(
             PhysicsBody(
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import math
+
+
+_HASH_X = 73856093
+_HASH_Y = 19349663
+
+
+@dataclass(slots=True)
+class SpatialHashGrid:
+    """균일 격자 broadphase (셀 해시 -> 바디 인덱스 비트셋)"""
+    cell_size: float = 64.0
+    buckets: dict[int, int] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if self.cell_size <= 0:
+            raise ValueError("cell_size must be > 0")
+
+    def clear(self) -> None:
+        self.buckets.clear()
+
+    def insert(self, index: int, x: float, y: float, radius: float) -> None:
+        inv_cell = 1.0 / self.cell_size
+        min_ix = math.floor((x - radius) * inv_cell)
+        max_ix = math.floor((x + radius) * inv_cell)
+        min_iy = math.floor((y - radius) * inv_cell)
+        max_iy = math.floor((y + radius) * inv_cell)
+        bit = 1 << index
+        buckets = self.buckets
+        for ix in range(min_ix, max_ix + 1):
+            hx = ix * _HASH_X
+            for iy in range(min_iy, max_iy + 1):
+                key = hx ^ (iy * _HASH_Y)
+                buckets[key] = buckets.get(key, 0) | bit
+
+    def candidate_pairs(self) -> list[tuple[int, int]]:
+        """같은 셀을 공유하는 (i, j) 쌍 (i < j, 사전순 정렬)"""
+        # 셀마다 최하위 비트부터 꺼내면 남은 비트는 모두 더 큰 인덱스이므로
+        # 바디별 "자신보다 큰 이웃" 비트셋에 OR 하면 중복 없이 모인다.
+        higher_neighbors: dict[int, int] = {}
+        for mask in self.buckets.values():
+            if mask & (mask - 1) == 0:
+                continue
+            while mask:
+                low = mask & -mask
+                mask ^= low
+                if not mask:
+                    break
+                i = low.bit_length() - 1
+                higher_neighbors[i] = higher_neighbors.get(i, 0) | mask
+
+        pairs: list[tuple[int, int]] = []
+        for i in sorted(higher_neighbors):
+            mask = higher_neighbors[i]
+            while mask:
+                low = mask & -mask
+                mask ^= low
+                pairs.append((i, low.bit_length() - 1))
+        return pairs
@@ -7,15 +7,17 @@ from pathlib import Path
 
 from autochess_combat.battle_sim import (
     DEFAULT_SETTINGS_PATH,
-    run_random_profile_sweep,
-    run_profile_sweep,
+    SweepResult,
+    load_settings_payload,
+    run_profile_sweep_from_settings_payload,
+    run_random_profile_sweep_from_settings_payload,
     sweep_result_to_html,
     sweep_result_to_json_dict,
     sweep_result_to_markdown,
 )
 
 
-def parse_args() -> argparse.Namespace:
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description=(
             "Run headless combat simulations from current visual_physics_lab settings "
@@ -56,6 +58,12 @@ def parse_args() -> argparse.Namespace:
         default=12.0,
         help="Random speed jitter applied to each ball on spawn.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for the seed runs (0 uses every CPU core).",
+    )
     parser.add_argument(
         "--output-md",
         type=Path,
@@ -74,7 +82,17 @@ def parse_args() -> argparse.Namespace:
         default=Path("reports") / "battle_feel_report",
         help="Output HTML visual report path.",
     )
-    return parser.parse_args()
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    args = _PARSER.parse_args(argv)
+    if args.workers < 0:
+        _PARSER.error("--workers must be >= 0")
+    return args
 
 
 def _timestamped(path: Path, suffix: str, stamp: str) -> Path:
@@ -82,43 +100,75 @@ def _timestamped(path: Path, suffix: str, stamp: str) -> Path:
     return path.parent / f"{stem}_{stamp}{suffix}"
 
 
-def main() -> int:
-    args = parse_args()
-    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    if args.mode == "profiles":
-        result = run_profile_sweep(
-            settings_path=args.settings,
-            seeds=args.seeds,
-            duration=args.duration,
-            dt=args.dt,
-            top_k=args.top_k,
-            speed_jitter=args.speed_jitter,
+def run_report(
+    *,
+    settings: Path = DEFAULT_SETTINGS_PATH,
+    mode: str = "profiles",
+    seeds: int = 6,
+    duration: float = 24.0,
+    dt: float = 1.0 / 120.0,
+    top_k: int = 10,
+    random_scenarios: int = 80,
+    profile_seed: int = 2026,
+    speed_jitter: float = 12.0,
+    workers: int | None = 1,
+    output_md: Path = Path("reports") / "battle_feel_report",
+    output_json: Path = Path("reports") / "battle_feel_report",
+    output_html: Path = Path("reports") / "battle_feel_report",
+    stamp: str | None = None,
+) -> tuple[SweepResult, Path, Path, Path]:
+    """argparse 없이 sweep을 돌리고 리포트 3종을 쓴다 -> (결과, md, json, html 경로)"""
+    if mode not in ("profiles", "random"):
+        raise ValueError("mode must be 'profiles' or 'random'")
+    if stamp is None:
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # 설정 파일은 여기서 한 번만 읽고, 파싱된 payload를 sweep 전체가 공유
+    settings_payload = load_settings_payload(settings)
+    settings_label = str(settings)
+    if mode == "profiles":
+        result = run_profile_sweep_from_settings_payload(
+            settings_payload=settings_payload,
+            settings_label=settings_label,
+            seeds=seeds,
+            duration=duration,
+            dt=dt,
+            top_k=top_k,
+            speed_jitter=speed_jitter,
+            workers=workers,
         )
     else:
-        result = run_random_profile_sweep(
-            settings_path=args.settings,
-            scenario_count=args.random_scenarios,
-            profile_seed=args.profile_seed,
-            seeds=args.seeds,
-            duration=args.duration,
-            dt=args.dt,
-            top_k=args.top_k,
-            speed_jitter=args.speed_jitter,
+        result = run_random_profile_sweep_from_settings_payload(
+            settings_payload=settings_payload,
+            settings_label=settings_label,
+            scenario_count=random_scenarios,
+            profile_seed=profile_seed,
+            seeds=seeds,
+            duration=duration,
+            dt=dt,
+            top_k=top_k,
+            speed_jitter=speed_jitter,
+            workers=workers,
         )
-    md_text = sweep_result_to_markdown(result)
-    html_text = sweep_result_to_html(result)
-    json_text = json.dumps(sweep_result_to_json_dict(result), indent=2)
-
-    output_md = _timestamped(args.output_md, ".md", stamp)
-    output_json = _timestamped(args.output_json, ".json", stamp)
-    output_html = _timestamped(args.output_html, ".html", stamp)
-
-    output_md.parent.mkdir(parents=True, exist_ok=True)
-    output_json.parent.mkdir(parents=True, exist_ok=True)
-    output_html.parent.mkdir(parents=True, exist_ok=True)
-    output_md.write_text(md_text, encoding="utf-8")
-    output_json.write_text(json_text, encoding="utf-8")
-    output_html.write_text(html_text, encoding="utf-8")
+    md_path = _timestamped(output_md, ".md", stamp)
+    json_path = _timestamped(output_json, ".json", stamp)
+    html_path = _timestamped(output_html, ".html", stamp)
+
+    md_path.parent.mkdir(parents=True, exist_ok=True)
+    json_path.parent.mkdir(parents=True, exist_ok=True)
+    html_path.parent.mkdir(parents=True, exist_ok=True)
+    md_path.write_text(sweep_result_to_markdown(result), encoding="utf-8")
+    html_path.write_text(sweep_result_to_html(result), encoding="utf-8")
+    # JSON은 전체 문자열을 만들지 않고 파일로 바로 인코딩
+    with json_path.open("w", encoding="utf-8") as fp:
+        json.dump(sweep_result_to_json_dict(result), fp, indent=2)
+    return result, md_path, json_path, html_path
+
+
+def main() -> int:
+    args = parse_args()
+    options = vars(args)
+    options["workers"] = args.workers or None
+    result, output_md, output_json, output_html = run_report(**options)
 
     top = result.top_scenarios[0] if result.top_scenarios else None
     print(f"mode: {args.mode}")
@@ -5,8 +5,12 @@ from pathlib import Path
 import tempfile
 import unittest
 
+from autochess_combat import battle_sim
 from autochess_combat.battle_sim import (
     BallProfile,
+    ball_class_to_profile,
+    ball_classes_to_profiles,
+    default_ball_classes,
     default_profiles,
     run_random_profile_sweep_from_settings_payload,
     run_profile_sweep_from_settings_payload,
@@ -15,6 +19,7 @@ from autochess_combat.battle_sim import (
     sweep_result_to_json_dict,
     sweep_result_to_markdown,
 )
+from autochess_combat.physics_lab import PhysicsTuning
 
 
 def _write_settings(path: Path) -> None:
@@ -93,6 +98,55 @@ class BattleSimTests(unittest.TestCase):
         self.assertIn("striker", names)
         self.assertIn("juggernaut", names)
 
+    def test_default_lists_are_fresh_copies(self) -> None:
+        profiles = default_profiles()
+        profiles.clear()
+        self.assertEqual(len(default_profiles()), 6)
+        classes = default_ball_classes()
+        classes.pop()
+        self.assertEqual(len(default_ball_classes()), 4)
+        self.assertIs(default_ball_classes()[0], classes[0])
+
+    def test_ball_classes_to_profiles_matches_single_conversion(self) -> None:
+        classes = default_ball_classes()
+        modifiers = [1.0, 1.2, 0.8, 1.5]
+        batch = ball_classes_to_profiles(classes + classes, modifiers + modifiers)
+        expected = [
+            ball_class_to_profile(ball_class, modifier)
+            for ball_class, modifier in zip(classes + classes, modifiers + modifiers)
+        ]
+        self.assertEqual(batch, expected)
+        self.assertEqual(ball_classes_to_profiles(classes), [ball_class_to_profile(c) for c in classes])
+        with self.assertRaises(ValueError):
+            ball_classes_to_profiles(classes, [1.0])
+
+    def test_profile_scaling_reaches_shaped_world_bodies(self) -> None:
+        profiles = {profile.name: profile for profile in default_profiles()}
+        base = [
+            battle_sim._normalize_ball_spec({"team": "left", "vx": 200.0}, 0),
+            battle_sim._normalize_ball_spec({"team": "right", "vx": -200.0}, 1),
+        ]
+
+        def build(profile: BallProfile) -> list:
+            world = battle_sim._build_world_from_normalized_specs(
+                width=1200.0,
+                height=400.0,
+                side_margin=80.0,
+                tuning=PhysicsTuning(),
+                specs=[battle_sim._apply_profile(spec, profile, 0.0) for spec in base],
+            )
+            return world.bodies
+
+        balanced = build(profiles["balanced"])
+        juggernaut_profile = profiles["juggernaut"]
+        juggernaut = build(juggernaut_profile)
+        for plain, shaped in zip(balanced, juggernaut):
+            self.assertAlmostEqual(plain.radius * juggernaut_profile.radius_scale, shaped.radius)
+            self.assertAlmostEqual(plain.mass * juggernaut_profile.mass_scale, shaped.mass)
+            self.assertAlmostEqual(plain.power * juggernaut_profile.power_scale, shaped.power)
+            self.assertAlmostEqual(plain.max_hp * juggernaut_profile.hp_scale, shaped.max_hp)
+            self.assertAlmostEqual(plain.hp * juggernaut_profile.hp_scale, shaped.hp)
+
     def test_run_profile_sweep_returns_ranked_results(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             settings_path = Path(temp_dir) / "settings.json"
@@ -128,6 +182,35 @@ class BattleSimTests(unittest.TestCase):
             self.assertEqual(4, json_dict["scenario_count"])
             self.assertIn("recommendations", json_dict)
 
+    def test_profile_sweep_with_worker_pool_matches_serial_run(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            settings_path = Path(temp_dir) / "settings.json"
+            _write_settings(settings_path)
+            profiles = [
+                BallProfile("balanced", 1.0, 1.0, 1.0, 1.0, 1.0),
+                BallProfile("tank", 1.25, 1.35, 0.9, 1.35, 0.9),
+            ]
+            kwargs = dict(
+                settings_path=settings_path,
+                profiles=profiles,
+                seeds=2,
+                duration=0.6,
+                dt=0.02,
+                top_k=4,
+                speed_jitter=5.0,
+                width=800.0,
+                height=300.0,
+            )
+            serial = run_profile_sweep(workers=1, **kwargs)
+            pooled = run_profile_sweep(workers=2, **kwargs)
+
+            self.assertEqual(
+                sweep_result_to_json_dict(serial)["top_scenarios"],
+                sweep_result_to_json_dict(pooled)["top_scenarios"],
+            )
+            with self.assertRaises(ValueError):
+                run_profile_sweep(workers=0, **kwargs)
+
     def test_run_profile_sweep_from_payload_uses_lab_like_data(self) -> None:
         payload = {
             "version": 1,
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+from pathlib import Path
+import tempfile
+import unittest
+
+from battle_sim_report import parse_args, run_report
+
+
+def _write_settings(path: Path) -> None:
+    payload = {
+        "version": 1,
+        "values": {"side_margin": 80.0},
+        "ball_specs": [
+            {"team": "left", "vx": 250.0},
+            {"team": "right", "vx": -220.0},
+        ],
+    }
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+class BattleSimReportTests(unittest.TestCase):
+    def test_run_report_writes_all_three_reports(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            settings_path = root / "settings.json"
+            _write_settings(settings_path)
+            result, md_path, json_path, html_path = run_report(
+                settings=settings_path,
+                seeds=1,
+                duration=0.5,
+                top_k=2,
+                output_md=root / "out" / "report",
+                output_json=root / "out" / "report",
+                output_html=root / "out" / "report",
+                stamp="fixed",
+            )
+
+            self.assertEqual(root / "out" / "report_fixed.md", md_path)
+            self.assertEqual(root / "out" / "report_fixed.json", json_path)
+            self.assertEqual(root / "out" / "report_fixed.html", html_path)
+            for path in (md_path, json_path, html_path):
+                self.assertTrue(path.exists())
+            summary = json.loads(json_path.read_text(encoding="utf-8"))
+            self.assertEqual(result.scenario_count, summary["scenario_count"])
+
+    def test_run_report_rejects_unknown_mode(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            settings_path = Path(temp_dir) / "settings.json"
+            _write_settings(settings_path)
+            with self.assertRaises(ValueError):
+                run_report(settings=settings_path, mode="bogus", stamp="fixed")
+
+    def test_parse_args_validates_workers(self) -> None:
+        self.assertEqual(0, parse_args(["--workers", "0"]).workers)
+        with contextlib.redirect_stderr(io.StringIO()):
+            with self.assertRaises(SystemExit):
+                parse_args(["--workers", "-1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
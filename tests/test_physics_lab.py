@@ -1,9 +1,12 @@
 import unittest
 
+import autochess_combat
+from autochess_combat import physics_lab
 from autochess_combat.physics_lab import (
     PhysicsBody,
     PhysicsTuning,
     PhysicsWorld,
+    Projectile,
     create_clash_world,
     create_duel_world,
 )
@@ -95,6 +98,17 @@ class PhysicsLabTests(unittest.TestCase):
         self.assertGreater(left.stagger_timer, 0.0)
         self.assertGreater(right.stagger_timer, 0.0)
 
+        self.assertEqual(1, len(world.contacts))
+        a_id, b_id, penetration, nx, ny = world.contacts[0]
+        self.assertEqual((0, 1), (a_id, b_id))
+        self.assertGreater(penetration, 0.0)
+        self.assertAlmostEqual(1.0, nx, places=6)
+        self.assertAlmostEqual(0.0, ny, places=6)
+        self.assertEqual(
+            [(0, 1)],
+            [PhysicsWorld.contact_pair(key) for key in world.active_contacts],
+        )
+
     def test_strong_ball_also_recoils_but_less(self) -> None:
         tuning = PhysicsTuning(
             gravity=0.0,
@@ -377,6 +391,23 @@ class PhysicsLabTests(unittest.TestCase):
         self.assertLess(left.hp, left.max_hp)
         self.assertEqual(0.0, right.last_damage)
 
+    def test_body_team_is_normalized_on_creation(self) -> None:
+        body = PhysicsBody(
+            body_id=0,
+            team=" Right ",
+            x=40.0,
+            y=50.0,
+            vx=0.0,
+            vy=0.0,
+            radius=10.0,
+            mass=1.0,
+            color="#f26b5e",
+        )
+        world = PhysicsWorld(width=200.0, height=100.0, bodies=[body], invincible_teams={"RIGHT"})
+
+        self.assertEqual("right", body.team)
+        self.assertTrue(world.is_team_invincible(body.team))
+
     def test_staggered_ball_recoils_then_charges_again(self) -> None:
         tuning = PhysicsTuning(
             gravity=0.0,
@@ -963,6 +994,143 @@ class PhysicsLabTests(unittest.TestCase):
 
         self.assertAlmostEqual(0.0, healer.vx, places=6)
 
+    def test_advance_splits_frame_into_substeps_and_clamps_long_frames(self) -> None:
+        stepped = create_duel_world(width=1200.0, height=500.0)
+        advanced = create_duel_world(width=1200.0, height=500.0)
+
+        for _ in range(4):
+            stepped.step(0.005)
+        advanced.advance(0.02, num_substeps=4)
+
+        self.assertAlmostEqual(stepped.time_elapsed, advanced.time_elapsed, places=9)
+        for expected, actual in zip(stepped.bodies, advanced.bodies):
+            self.assertAlmostEqual(expected.x, actual.x, places=9)
+            self.assertAlmostEqual(expected.vx, actual.vx, places=9)
+
+        advanced.advance(1.0, num_substeps=2)
+        self.assertAlmostEqual(0.02 + (1.0 / 30.0), advanced.time_elapsed, places=9)
+
+        with self.assertRaises(ValueError):
+            advanced.advance(0.02, num_substeps=0)
+
+    def test_fast_projectile_does_not_tunnel_through_target(self) -> None:
+        tuning = PhysicsTuning(
+            gravity=0.0,
+            approach_force=0.0,
+            linear_damping=0.0,
+            ground_friction=0.0,
+        )
+        shooter = PhysicsBody(
+            body_id=0,
+            team="left",
+            x=40.0,
+            y=80.0,
+            vx=0.0,
+            vy=0.0,
+            radius=10.0,
+            mass=1.0,
+            color="#4aa3ff",
+            forward_dir=1.0,
+        )
+        target = PhysicsBody(
+            body_id=1,
+            team="right",
+            x=300.0,
+            y=80.0,
+            vx=0.0,
+            vy=0.0,
+            radius=10.0,
+            mass=1.0,
+            color="#f26b5e",
+            forward_dir=-1.0,
+        )
+        world = PhysicsWorld(width=600.0, height=200.0, bodies=[shooter, target], tuning=tuning)
+        # 한 스텝에 120px 이동: 끝점(370)은 타겟을 이미 지나친 위치
+        world.projectiles.append(
+            Projectile(
+                proj_id=0,
+                owner_id=0,
+                team="left",
+                x=250.0,
+                y=80.0,
+                vx=6000.0,
+                vy=0.0,
+                radius=5.0,
+                damage=7.0,
+                knockback_force=0.0,
+                color="#4aa3ff",
+                lifetime=2.0,
+            )
+        )
+
+        world.step(0.02)
+
+        self.assertEqual([], world.projectiles)
+        self.assertAlmostEqual(target.max_hp - 7.0, target.hp, places=6)
+
+    def test_fast_projectile_hits_target_before_leaving_or_expiring(self) -> None:
+        tuning = PhysicsTuning(
+            gravity=0.0,
+            approach_force=0.0,
+            linear_damping=0.0,
+            ground_friction=0.0,
+        )
+        # 벽에 붙은 타겟: 끝점(660)은 월드 밖 / 수명이 이번 스텝 안에 끝나는 경우
+        for lifetime in (2.0, 0.01):
+            shooter = PhysicsBody(
+                body_id=0,
+                team="left",
+                x=40.0,
+                y=80.0,
+                vx=0.0,
+                vy=0.0,
+                radius=10.0,
+                mass=1.0,
+                color="#4aa3ff",
+                forward_dir=1.0,
+            )
+            target = PhysicsBody(
+                body_id=1,
+                team="right",
+                x=590.0,
+                y=80.0,
+                vx=0.0,
+                vy=0.0,
+                radius=10.0,
+                mass=1.0,
+                color="#f26b5e",
+                forward_dir=-1.0,
+            )
+            world = PhysicsWorld(width=600.0, height=200.0, bodies=[shooter, target], tuning=tuning)
+            world.projectiles.append(
+                Projectile(
+                    proj_id=0,
+                    owner_id=0,
+                    team="left",
+                    x=540.0,
+                    y=80.0,
+                    vx=6000.0,
+                    vy=0.0,
+                    radius=5.0,
+                    damage=7.0,
+                    knockback_force=0.0,
+                    color="#4aa3ff",
+                    lifetime=lifetime,
+                )
+            )
+
+            world.step(0.02)
+
+            self.assertEqual([], world.projectiles)
+            self.assertAlmostEqual(target.max_hp - 7.0, target.hp, places=6)
+
+    def test_package_exports_resolve_to_physics_lab(self) -> None:
+        for name in autochess_combat.__all__:
+            self.assertIn(name, physics_lab.__all__)
+            self.assertIs(getattr(physics_lab, name), getattr(autochess_combat, name))
+        with self.assertRaises(AttributeError):
+            getattr(autochess_combat, "does_not_exist")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,56 @@
+import random
+import unittest
+
+from autochess_combat.physics_lab import create_clash_world
+from autochess_combat.spatial_hash import SpatialHashGrid
+
+
+class SpatialHashGridTests(unittest.TestCase):
+    def test_candidate_pairs_cover_every_overlapping_pair(self) -> None:
+        rng = random.Random(11)
+        circles = [
+            (rng.uniform(0.0, 400.0), rng.uniform(0.0, 300.0), rng.uniform(4.0, 20.0))
+            for _ in range(120)
+        ]
+        grid = SpatialHashGrid(cell_size=24.0)
+        for idx, (x, y, r) in enumerate(circles):
+            grid.insert(idx, x, y, r)
+
+        candidates = grid.candidate_pairs()
+        self.assertEqual(sorted(candidates), candidates)
+        self.assertEqual(len(set(candidates)), len(candidates))
+
+        candidate_set = set(candidates)
+        for i in range(len(circles)):
+            for j in range(i + 1, len(circles)):
+                xi, yi, ri = circles[i]
+                xj, yj, rj = circles[j]
+                dx = xj - xi
+                dy = yj - yi
+                if dx * dx + dy * dy < (ri + rj) * (ri + rj):
+                    self.assertIn((i, j), candidate_set)
+
+    def test_clear_drops_previous_frame(self) -> None:
+        grid = SpatialHashGrid(cell_size=10.0)
+        grid.insert(0, 5.0, 5.0, 2.0)
+        grid.insert(1, 6.0, 5.0, 2.0)
+        self.assertEqual([(0, 1)], grid.candidate_pairs())
+
+        grid.clear()
+        grid.insert(0, 5.0, 5.0, 2.0)
+        grid.insert(1, 95.0, 5.0, 2.0)
+        self.assertEqual([], grid.candidate_pairs())
+
+    def test_invalid_cell_size_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            SpatialHashGrid(cell_size=0.0)
+
+    def test_large_clash_world_steps_with_grid_broadphase(self) -> None:
+        world = create_clash_world(player_count=24, monster_count=24, seed=3)
+        for _ in range(240):
+            world.step(1.0 / 120.0)
+        self.assertGreater(world.total_collisions, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -195,7 +195,7 @@ CUSTOM_BALLS_TEMPLATE: dict[str, object] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class RingEffect:
     x: float
     y: float
@@ -207,7 +207,7 @@ class RingEffect:
     width: float
 
 
-@dataclass
+@dataclass(slots=True)
 class FloatingTextEffect:
     x: float
     y: float
@@ -220,7 +220,7 @@ class FloatingTextEffect:
     font_size: int
 
 
-@dataclass
+@dataclass(slots=True)
 class HpBarAnimState:
     display_ratio: float
     chip_ratio: float
@@ -229,7 +229,7 @@ class HpBarAnimState:
     pulse_color: str = "#4ad06f"
 
 
-@dataclass
+@dataclass(slots=True)
 class DeathParticleEffect:
     x: float
     y: float
@@ -241,7 +241,7 @@ class DeathParticleEffect:
     duration: float
 
 
-@dataclass
+@dataclass(slots=True)
 class DeathFadeState:
     x: float
     y: float